@@ -13,6 +13,7 @@ Report types:
 import argparse
 import importlib
 import importlib.util
+import logging
 import os
 import sys
 
@@ -120,6 +121,14 @@ Examples:
                         help='Build Word doc only (default behavior — reserved for future PDF step)')
 
     args = parser.parse_args()
+    # Show the generator's progress messages; the root logger is left alone
+    # so library INFO logging stays quiet
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    handler.setLevel(logging.INFO)
+    report_logger = logging.getLogger('functions.test_report_generator')
+    report_logger.addHandler(handler)
+    report_logger.setLevel(logging.INFO)
 
     project_dir = os.path.abspath(args.project)
     if not os.path.isdir(project_dir):
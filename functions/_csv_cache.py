@@ -0,0 +1,56 @@
+"""In-process LRU cache for the raw CSV parsers.
+
+Entries are keyed on the file's path, mtime and size plus the parser
+arguments, so an edited file is always re-parsed. Callers get their own
+deep copy of the cached frame (copying is far cheaper than parsing), so
+they may add or modify columns freely on any pandas version.
+"""
+
+import os
+from collections import OrderedDict
+
+from .parse_csv import parse_seismic_csv, parse_resonance_csv
+
+
+_MAX_ENTRIES = 8
+_CACHE = OrderedDict()
+
+
+def _file_key(filepath):
+    st = os.stat(filepath)
+    return os.path.abspath(filepath), st.st_mtime_ns, st.st_size
+
+
+def _cached(key, parse):
+    df = _CACHE.get(key)
+    if df is None:
+        df = parse()
+        _CACHE[key] = df
+        if len(_CACHE) > _MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    else:
+        _CACHE.move_to_end(key)
+    return df.copy()
+
+
+def cached_parse_seismic_csv(filepath, column_mapping, time_unit='ms',
+                             trim_start=None, duration=None):
+    """parse_seismic_csv with results reused while the file is unchanged."""
+    key = ('seismic', *_file_key(filepath), tuple(column_mapping.items()),
+           time_unit, trim_start, duration)
+    return _cached(key, lambda: parse_seismic_csv(
+        filepath, column_mapping, time_unit=time_unit,
+        trim_start=trim_start, duration=duration))
+
+
+def cached_parse_resonance_csv(filepath, column_mapping, high_cutoff=None):
+    """parse_resonance_csv with results reused while the file is unchanged."""
+    key = ('resonance', *_file_key(filepath), tuple(column_mapping.items()),
+           high_cutoff)
+    return _cached(key, lambda: parse_resonance_csv(
+        filepath, column_mapping, high_cutoff=high_cutoff))
+
+
+def clear_cache():
+    """Drop all cached frames."""
+    _CACHE.clear()
@@ -0,0 +1,56 @@
+"""Shared axis logic for the TRS and TRS overlay plots."""
+
+import numpy as np
+import matplotlib.ticker as ticker
+
+from . import plot_style as S
+
+
+# y_max cascade from MATLAB plotTRS.m: upper_y below _Y_THRESHOLDS[i] -> _Y_MAXES[i]
+_Y_THRESHOLDS = np.array([3, 5, 7.5, 10])
+_Y_MAXES      = np.array([4, 6.5, 9, 12])
+
+_X_TICK_LABELS = [str(t) for t in S.TRS_X_TICKS]
+_Y_TICK_LABELS = [str(t) for t in S.TRS_Y_TICKS]
+
+
+def trs_y_max(upper_y, max_trs):
+    """Return the TRS plot y-axis upper limit for the given peak values."""
+    i = np.searchsorted(_Y_THRESHOLDS, upper_y, side='right')
+    if i < len(_Y_MAXES):
+        return float(_Y_MAXES[i])
+    return float(np.ceil(max_trs * 1.2))
+
+
+def configure_trs_axes(ax, y_min, y_max):
+    """Apply limits, grid, ticks and spines shared by the TRS plots.
+
+    Call after all curves are drawn: the fixed tick formatters set here
+    would otherwise be reset by later log-scale plotting calls.
+    """
+    # --- Axis limits ---
+    ax.set_xlim(S.TRS_X_LIM)
+    ax.set_ylim([y_min, y_max])
+
+    # --- Grid ---
+    ax.grid(True, which='major', color=S.TRS_GRID_MAJOR_COLOR, linewidth=S.TRS_GRID_MAJOR_LW)
+    ax.grid(True, which='minor', color=S.TRS_GRID_MINOR_COLOR, linewidth=S.TRS_GRID_MINOR_LW)
+
+    # --- Tick labels ---
+    ax.set_xticks(S.TRS_X_TICKS)
+    ax.xaxis.set_major_formatter(ticker.FixedFormatter(_X_TICK_LABELS))
+    ax.xaxis.set_minor_locator(ticker.AutoMinorLocator())
+
+    ax.set_yticks(S.TRS_Y_TICKS)
+    ax.yaxis.set_major_formatter(ticker.FixedFormatter(_Y_TICK_LABELS))
+    ax.yaxis.set_minor_locator(ticker.AutoMinorLocator())
+
+    ax.tick_params(axis='both', which='major', direction=S.TICK_DIRECTION,
+                   top=S.TICK_TOP, right=S.TICK_RIGHT,
+                   length=S.TICK_MAJOR_LENGTH_TRS, width=S.TICK_MAJOR_WIDTH,
+                   labelsize=S.FONT_SIZE_TICKS)
+    ax.tick_params(axis='both', which='minor', direction=S.TICK_DIRECTION,
+                   top=S.TICK_TOP, right=S.TICK_RIGHT,
+                   length=S.TICK_MINOR_LENGTH, width=S.TICK_MINOR_WIDTH)
+    ax.spines['top'].set_visible(True)
+    ax.spines['right'].set_visible(True)
@@ -0,0 +1,14 @@
+"""Load YAML run configs, using the LibYAML parser when PyYAML was built with it."""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+def load_config(path):
+    """Parse a YAML config file with the safe loader."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
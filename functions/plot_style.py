@@ -196,6 +196,9 @@ TRS_ALL_COLORS = {
 
 TH_SIGNAL_COLOR = 'black'      # Time history trace
 TH_SIGNAL_LW    = 1.0
+TH_SIGNAL_RASTERIZED = True    # Embed the trace as a bitmap (at FIG_DPI) inside the SVG.
+                               # Keeps SVG size sane for long records; axes and text
+                               # stay vector. No effect on PNG output.
 
 TH_ARIG_COLOR = 'blue'         # ±Arig_90 threshold dashed lines
 TH_ARIG_LW    = 1.0
@@ -49,7 +49,8 @@ def plot_th(run_name, accel_name, time, accel, Arig_90, plot_options):
     ax.set_facecolor(S.BG_AXES)
 
     # --- Signal trace ---
-    ax.plot(time, accel, color=S.TH_SIGNAL_COLOR, linewidth=S.TH_SIGNAL_LW)
+    ax.plot(time, accel, color=S.TH_SIGNAL_COLOR, linewidth=S.TH_SIGNAL_LW,
+            rasterized=S.TH_SIGNAL_RASTERIZED)
 
     # --- Arig_90 threshold lines (Table channels only) ---
     if is_table:
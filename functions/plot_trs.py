@@ -4,9 +4,9 @@ import numpy as np
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
 
 from . import plot_style as S
+from ._trs_axes import configure_trs_axes, trs_y_max
 
 
 def plot_trs(run_name, accel_name, freq72, RRS, Aflx, Arig,
@@ -21,17 +21,7 @@ def plot_trs(run_name, accel_name, freq72, RRS, Aflx, Arig,
     max_trs  = np.max(TRS06)
     is_table = 'Table' in accel_name
     upper_y  = max(max_trs, 1.3 * Aflx) if is_table else max_trs
-
-    if upper_y < 3:
-        y_max = 4
-    elif upper_y < 5:
-        y_max = 6.5
-    elif upper_y < 7.5:
-        y_max = 9
-    elif upper_y < 10:
-        y_max = 12
-    else:
-        y_max = np.ceil(max_trs * 1.2)
+    y_max    = trs_y_max(upper_y, max_trs)
 
     y_min = min(np.floor(Arig * 0.85 * 10) / 10, 0.9)
 
@@ -83,32 +73,8 @@ def plot_trs(run_name, accel_name, freq72, RRS, Aflx, Arig,
                 color=S.REF_TEXT_COLOR, ha='left', va='bottom',
                 fontsize=S.FONT_SIZE_TEXT)
 
-    # --- Axis limits ---
-    ax.set_xlim(S.TRS_X_LIM)
-    ax.set_ylim([y_min, y_max])
-
-    # --- Grid ---
-    ax.grid(True, which='major', color=S.TRS_GRID_MAJOR_COLOR, linewidth=S.TRS_GRID_MAJOR_LW)
-    ax.grid(True, which='minor', color=S.TRS_GRID_MINOR_COLOR, linewidth=S.TRS_GRID_MINOR_LW)
-
-    # ── Tick labels set AFTER all plotting (prevents loglog formatter reset) ───
-    ax.set_xticks(S.TRS_X_TICKS)
-    ax.xaxis.set_major_formatter(ticker.FixedFormatter([str(t) for t in S.TRS_X_TICKS]))
-    ax.xaxis.set_minor_locator(ticker.AutoMinorLocator())
-
-    ax.set_yticks(S.TRS_Y_TICKS)
-    ax.yaxis.set_major_formatter(ticker.FixedFormatter([str(t) for t in S.TRS_Y_TICKS]))
-    ax.yaxis.set_minor_locator(ticker.AutoMinorLocator())
-
-    ax.tick_params(axis='both', which='major', direction=S.TICK_DIRECTION,
-                   top=S.TICK_TOP, right=S.TICK_RIGHT,
-                   length=S.TICK_MAJOR_LENGTH_TRS, width=S.TICK_MAJOR_WIDTH,
-                   labelsize=S.FONT_SIZE_TICKS)
-    ax.tick_params(axis='both', which='minor', direction=S.TICK_DIRECTION,
-                   top=S.TICK_TOP, right=S.TICK_RIGHT,
-                   length=S.TICK_MINOR_LENGTH, width=S.TICK_MINOR_WIDTH)
-    ax.spines['top'].set_visible(True)
-    ax.spines['right'].set_visible(True)
+    # ── Limits, grid and ticks set AFTER all plotting (prevents loglog formatter reset) ──
+    configure_trs_axes(ax, y_min, y_max)
 
     # --- Title and labels ---
     # Note: MATLAB does NOT bold xlabel/ylabel on TRS plots (unlike CC/CH/resonance)
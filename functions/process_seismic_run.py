@@ -1,5 +1,7 @@
 """Process a complete seismic run: filter, TRS, plots."""
 
+from collections import defaultdict
+
 import numpy as np
 from .filter_data import filter_th
 from .calc_trs import calc_trs
@@ -11,7 +13,7 @@ from .plot_cc import plot_cc
 from .plot_ch import plot_ch
 from .calc_cc import calc_cc
 from .calc_ch import calc_ch
-from .save_plot import save_plot
+from .save_plot import save_plot, wait_for_writes
 from .save_trs import save_trs
 
 
@@ -49,20 +51,23 @@ def process_seismic_run(seismic, config, seismic_data, output_dir, script_dir=No
 
     plot_number = 1
 
-    # Apply filters and store filtered data
-    filtered_data = {'Time': time}
-    for col in seismic_data.columns:
-        if col == 'Time':
-            continue
-        accel = seismic_data[col].values
+    # Apply filters into one contiguous (channel x sample) block;
+    # channel_row maps a column name to its row. Every row handed to
+    # filter_th / calc_trs / calc_cc / calc_ch is a contiguous float64 buffer.
+    channel_names = [col for col in seismic_data.columns if col != 'Time']
+    channel_row = {col: i for i, col in enumerate(channel_names)}
+    filtered_data = np.empty((len(channel_names), len(time)), dtype=np.float64)
+    for i, col in enumerate(channel_names):
+        accel = np.ascontiguousarray(seismic_data[col].to_numpy(), dtype=np.float64)
         filt = filters_config.get(col)
         if filt is not None:
             accel = filter_th(accel, sample_rate, filt['order'], filt['cutoff_hz'])
-        filtered_data[col] = accel
+        filtered_data[i] = accel
 
-    # Storage for TRS results per column
+    # Storage for TRS results per column, and per accel -> axis for the overlays
     freq06_all = {}
     TRS06_all = {}
+    overlay = defaultdict(dict)
 
     # Process Table axes first, then accels
     all_accel_names = ['Table'] + [a['name'] for a in accels_config]
@@ -76,11 +81,11 @@ def process_seismic_run(seismic, config, seismic_data, output_dir, script_dir=No
             else:
                 col_name = f'{accel_label}_{axis}'
 
-            if col_name not in filtered_data:
+            if col_name not in channel_row:
                 print(f'Warning: column {col_name} not found, skipping')
                 continue
 
-            accel = filtered_data[col_name]
+            accel = filtered_data[channel_row[col_name]]
 
             # Determine Arig_90 for time history plot
             if axis == 'Z':
@@ -106,6 +111,7 @@ def process_seismic_run(seismic, config, seismic_data, output_dir, script_dir=No
 
             freq06_all[col_name] = freq06
             TRS06_all[col_name] = TRS06
+            overlay[accel_label][axis] = (freq06, TRS06)
 
             # TRS plot
             fig = plot_trs(run_name, col_name, freq72, RRS, Aflx, Arig,
@@ -114,37 +120,25 @@ def process_seismic_run(seismic, config, seismic_data, output_dir, script_dir=No
                                    plot_number, output_dir)
 
     # TRS all-axes overlay plots
-    for accel_label in all_accel_names:
-        is_table = accel_label == 'Table'
-        accel_name_full = accel_label
-
-        freq06_per_axis = {}
-        TRS06_per_axis = {}
-        for axis in axes:
-            if is_table:
-                col_name = f'Table_{axis}'
-            else:
-                col_name = f'{accel_label}_{axis}'
-            if col_name in freq06_all:
-                freq06_per_axis[axis] = freq06_all[col_name]
-                TRS06_per_axis[axis] = TRS06_all[col_name]
-
-        if freq06_per_axis:
-            fig = plot_trs_all(run_name, accel_name_full, axes, freq72,
-                               RRS_h, RRS_v,
-                               seismic['Aflx_h'], seismic['Aflx_v'],
-                               seismic['Arig_h'], seismic['Arig_v'],
-                               damping, low_cutoff,
-                               freq06_per_axis, TRS06_per_axis, plot_options)
-            plot_number = save_plot(fig, f'TRSvsRRS_All_{accel_name_full}',
-                                   run_name, plot_number, output_dir)
+    for accel_label, per_axis in overlay.items():
+        freq06_per_axis = {a: v[0] for a, v in per_axis.items()}
+        TRS06_per_axis = {a: v[1] for a, v in per_axis.items()}
+
+        fig = plot_trs_all(run_name, accel_label, axes, freq72,
+                           RRS_h, RRS_v,
+                           seismic['Aflx_h'], seismic['Aflx_v'],
+                           seismic['Arig_h'], seismic['Arig_v'],
+                           damping, low_cutoff,
+                           freq06_per_axis, TRS06_per_axis, plot_options)
+        plot_number = save_plot(fig, f'TRSvsRRS_All_{accel_label}',
+                               run_name, plot_number, output_dir)
 
     # Save TRS to Excel (in script_dir to match MATLAB, falls back to output_dir)
     excel_dir = script_dir if script_dir else output_dir
     save_trs(run_name, axes, freq06_all, TRS06_all, seismic, excel_dir)
 
     # Cross-correlation
-    table_data = {k: v for k, v in filtered_data.items() if k.startswith('Table_')}
+    table_data = {k: filtered_data[i] for k, i in channel_row.items() if k.startswith('Table_')}
     cc_result = calc_cc(table_data, dt)
     fig = plot_cc(cc_result, run_name, plot_options)
     plot_number = save_plot(fig, 'CC', run_name, plot_number, output_dir)
@@ -154,4 +148,5 @@ def process_seismic_run(seismic, config, seismic_data, output_dir, script_dir=No
     fig = plot_ch(ch_result, run_name, plot_options)
     plot_number = save_plot(fig, 'CH', run_name, plot_number, output_dir)
 
+    wait_for_writes()
     print(f'\nSeismic processing complete. {plot_number - 1} plots saved to {output_dir}')
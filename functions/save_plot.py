@@ -1,12 +1,42 @@
 """Save figure as both SVG and PNG with sequential numbering."""
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 import matplotlib.pyplot as plt
 
+from . import plot_style as S
+
+
+# Disk writes run on a shared pool so they overlap with rendering the next figure
+_WRITER = ThreadPoolExecutor(max_workers=4)
+_pending = []
+
+
+def _write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def wait_for_writes():
+    """Block until all queued plot files are on disk.
+
+    Re-raises the first write error, if any.
+    """
+    global _pending
+    futures, _pending = _pending, []
+    wait(futures)
+    for fut in futures:
+        fut.result()
+
 
 def save_plot(fig, name, run_name, plot_number, output_dir):
     """Save figure as SVG and PNG.
 
+    The figure is rendered to memory on the calling thread; the file writes
+    are queued on a background pool. Call wait_for_writes() before relying
+    on the files being present.
+
     Parameters
     ----------
     fig : matplotlib.figure.Figure
@@ -26,8 +56,14 @@ def save_plot(fig, name, run_name, plot_number, output_dir):
     svg_path = os.path.join(output_dir, f"{filename}.svg")
     png_path = os.path.join(output_dir, f"{filename}.png")
 
-    fig.savefig(svg_path, format='svg', facecolor='white')
-    fig.savefig(png_path, dpi=150, facecolor='white')
-    print(png_path)
+    svg_buf = io.BytesIO()
+    png_buf = io.BytesIO()
+    # dpi only affects rasterized artists in the SVG (e.g. long TH traces)
+    fig.savefig(svg_buf, format='svg', dpi=S.FIG_DPI, facecolor='white')
+    fig.savefig(png_buf, format='png', dpi=S.FIG_DPI, facecolor='white')
     plt.close(fig)
+
+    _pending.append(_WRITER.submit(_write_file, svg_path, svg_buf.getvalue()))
+    _pending.append(_WRITER.submit(_write_file, png_path, png_buf.getvalue()))
+    print(png_path)
     return plot_number + 1
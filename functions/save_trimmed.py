@@ -0,0 +1,35 @@
+"""Save trimmed run data as CSV (default) or Parquet."""
+
+import os
+
+
+def save_trimmed(data, script_dir, stem, output_format='csv'):
+    """Write the trimmed DataFrame to script_dir/<stem>.<csv|parquet>.
+
+    Parquet keeps the float columns in binary form, so the file is smaller
+    and faster to write and re-read than CSV. It needs pyarrow (or
+    fastparquet) installed; CSV stays the default.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+    script_dir : str
+    stem : str
+        File name without extension (e.g. 'Run_1_trimmed').
+    output_format : str
+        'csv' or 'parquet'.
+
+    Returns
+    -------
+    str
+        Path of the written file.
+    """
+    if output_format == 'csv':
+        path = os.path.join(script_dir, f'{stem}.csv')
+        data.to_csv(path, index=False)
+    elif output_format == 'parquet':
+        path = os.path.join(script_dir, f'{stem}.parquet')
+        data.to_parquet(path, compression='zstd', index=False)
+    else:
+        raise ValueError(f"Unknown output_format '{output_format}' (expected 'csv' or 'parquet')")
+    return path
@@ -1,9 +1,69 @@
-"""Save TRS data to Excel using openpyxl."""
+"""Save TRS data to Excel using xlsxwriter (if installed) or openpyxl."""
 
 import os
 import numpy as np
 from openpyxl import Workbook
 
+try:
+    import xlsxwriter
+except ImportError:  # optional: faster pure writer, openpyxl used otherwise
+    xlsxwriter = None
+
+
+# Column mapping: axis -> starting column (0-indexed)
+_AXIS_TO_COL = {'X': 0, 'Y': 3, 'Z': 6, 'D': 9}
+_N_COLS = max(_AXIS_TO_COL.values()) + 3
+
+# Direction labels for header row 1, column labels for header row 2
+_DIRECTION_LABELS = {'X': 'X Direction', 'Y': 'Y Direction',
+                     'Z': 'Z Direction', 'D': 'D Direction'}
+_SUB_HEADERS = ('Freq.\n(Hz)', 'RRS\n(g)', 'TRS\n(g)')
+
+
+def _trs_columns(axes, freq06_all, TRS06_all, seismic):
+    """Return [(axis, freq, RRS, TRS)] for the Table axes with TRS data.
+
+    Arrays hold the 1/6-octave frequencies above 1.0 Hz with the RRS
+    interpolated at them. Values are unrounded; save_trs rounds the
+    assembled sheet in one pass.
+    """
+    # Filter: only include frequencies > 1.0 Hz (before interpolating, so
+    # dropped points are never interpolated). freq06 is an ascending
+    # 1/6-octave subsample of freq72, so the kept points are a contiguous
+    # tail and can be taken as views.
+    table_axes = []
+    freq06_list = []
+    TRS06_list = []
+    for axis in axes:
+        table_col = f'Table_{axis}'
+        if table_col not in freq06_all:
+            continue
+        freq06 = freq06_all[table_col]
+        first = np.searchsorted(freq06, 1.0, side='right')
+        table_axes.append(axis)
+        freq06_list.append(freq06[first:])
+        TRS06_list.append(TRS06_all[table_col][first:])
+
+    # Get RRS at the 1/6 octave frequencies. Axes of the same polarity often
+    # share a grid, so each distinct grid is interpolated once: one np.interp
+    # per polarity over its concatenated distinct grids, then sliced back.
+    RRS_list = [None] * len(table_axes)
+    for is_horizontal, RRS_full in ((True, seismic['RRS_h']), (False, seismic['RRS_v'])):
+        grids = {}  # grid bytes -> indices of the axes using that grid
+        for k, axis in enumerate(table_axes):
+            if (axis in ('X', 'Y', 'D')) == is_horizontal:
+                grids.setdefault(freq06_list[k].tobytes(), []).append(k)
+        if not grids:
+            continue
+        unique_freqs = [freq06_list[ks[0]] for ks in grids.values()]
+        interp_RRS = np.interp(np.concatenate(unique_freqs), seismic['freq72'], RRS_full)
+        offsets = np.cumsum([0] + [len(f) for f in unique_freqs])
+        for j, ks in enumerate(grids.values()):
+            for k in ks:
+                RRS_list[k] = interp_RRS[offsets[j]:offsets[j + 1]]
+
+    return list(zip(table_axes, freq06_list, RRS_list, TRS06_list))
+
 
 def save_trs(run_name, axes, freq06_all, TRS06_all, seismic, output_dir):
     """Save TRS vs RRS data to Excel file.
@@ -16,78 +76,56 @@ def save_trs(run_name, axes, freq06_all, TRS06_all, seismic, output_dir):
       Col K:    Low resonance (row 3), Cutoff (row 4)
       Col L:    Text labels (rows 3, 4)
     """
-    # Column mapping: axis -> starting column (0-indexed)
-    axis_to_col = {'X': 0, 'Y': 3, 'Z': 6, 'D': 9}
-
+    os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, f'{run_name}_Table_TRSvsRRS.xlsx')
 
-    wb = Workbook()
-    ws = wb.active
-
-    # Direction labels for header row 1
-    direction_labels = {'X': 'X Direction', 'Y': 'Y Direction',
-                        'Z': 'Z Direction', 'D': 'D Direction'}
-
-    # Write header row 1
-    for axis in axes:
-        col_start = axis_to_col.get(axis, 0)
-        ws.cell(row=1, column=col_start + 1, value=direction_labels.get(axis))
-
-    # Write header row 2
-    for axis in axes:
-        col_start = axis_to_col.get(axis, 0)
-        ws.cell(row=2, column=col_start + 1, value='Freq.\n(Hz)')
-        ws.cell(row=2, column=col_start + 2, value='RRS\n(g)')
-        ws.cell(row=2, column=col_start + 3, value='TRS\n(g)')
-
-    freq72 = seismic['freq72']
-
+    # Header rows 1 and 2 (only for the configured axes)
+    header_row = [None] * _N_COLS
+    sub_header_row = [None] * _N_COLS
     for axis in axes:
-        table_col = f'Table_{axis}'
-        if table_col not in freq06_all:
-            continue
-
-        current_freq06 = freq06_all[table_col]
-        current_TRS06 = TRS06_all[table_col]
-
-        # Get RRS at the 1/6 octave frequencies
-        if axis in ('X', 'Y', 'D'):
-            RRS_full = seismic['RRS_h']
-        else:
-            RRS_full = seismic['RRS_v']
-
-        # Match frequencies
-        current_RRS = np.interp(current_freq06, freq72, RRS_full)
-
-        # Filter: only include frequencies > 1.0 Hz
-        valid = current_freq06 > 1.0
-        current_freq06 = current_freq06[valid]
-        current_RRS = current_RRS[valid]
-        current_TRS06 = current_TRS06[valid]
-
-        # Round to 2 decimal places
-        current_freq06 = np.round(current_freq06, 2)
-        current_RRS = np.round(current_RRS, 2)
-        current_TRS06 = np.round(current_TRS06, 2)
-
-        # Write to Excel
-        col_start = axis_to_col.get(axis, 0)
-        row_start = 3
-
-        for i in range(len(current_freq06)):
-            ws.cell(row=row_start + i, column=col_start + 1,
-                    value=float(current_freq06[i]))
-            ws.cell(row=row_start + i, column=col_start + 2,
-                    value=float(current_RRS[i]))
-            ws.cell(row=row_start + i, column=col_start + 3,
-                    value=float(current_TRS06[i]))
-
-    # Write low resonance and cutoff annotations (K/L columns, matching baseline)
-    ws.cell(row=3, column=11, value=seismic['lowResonance'])
-    ws.cell(row=3, column=12, value='<- Lowest Resonance')
-    ws.cell(row=4, column=11, value=seismic['lowCutoff'])
-    ws.cell(row=4, column=12, value='<- Cuttoff Frequency')
-
-    os.makedirs(output_dir, exist_ok=True)
-    wb.save(output_file)
+        col_start = _AXIS_TO_COL.get(axis, 0)
+        header_row[col_start] = _DIRECTION_LABELS.get(axis)
+        sub_header_row[col_start:col_start + 3] = _SUB_HEADERS
+
+    columns = _trs_columns(axes, freq06_all, TRS06_all, seismic)
+
+    # Assemble all data rows (row 3 onward) in one preallocated buffer;
+    # NaN marks empty cells
+    n_rows = max((len(c[1]) for c in columns), default=0)
+    data = np.full((max(n_rows, 2), _N_COLS), np.nan)
+    for axis, *values in columns:
+        col_start = _AXIS_TO_COL.get(axis, 0)
+        for j, col_values in enumerate(values):
+            data[:len(col_values), col_start + j] = col_values
+
+    # Round to 2 decimal places in place (NaN stays NaN). Same steps as
+    # np.round(data, 2), without its temporaries; divide (not * 0.01) to
+    # stay bit-identical.
+    data *= 100.0
+    np.rint(data, out=data)
+    data /= 100.0
+    rows = data.astype(object)
+    rows[np.isnan(data)] = None
+    rows = rows.tolist()
+
+    # Low resonance and cutoff annotations (K/L columns of rows 3/4, matching baseline)
+    rows[0][10:12] = (seismic['lowResonance'], '<- Lowest Resonance')
+    rows[1][10:12] = (seismic['lowCutoff'], '<- Cuttoff Frequency')
+
+    sheet_rows = [header_row, sub_header_row] + rows
+    if xlsxwriter is not None:
+        # constant_memory flushes each row as it is written: rows must go in order
+        wb = xlsxwriter.Workbook(output_file, {'constant_memory': True})
+        ws = wb.add_worksheet('Sheet')
+        for r, row in enumerate(sheet_rows):
+            ws.write_row(r, 0, row)
+        wb.close()
+    else:
+        # Write-only workbook streams rows straight to XML: rows must be
+        # appended in order, so the full matrix is built first
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        for row in sheet_rows:
+            ws.append(row)
+        wb.save(output_file)
     print(f'TRS data saved to {output_file}')
@@ -15,13 +15,80 @@ Sections produced:
 
 import os
 import re
-import glob
-
+import copy
+import fnmatch
+import io
+import struct
+import hashlib
+import tempfile
+import threading
+import time
+import functools
+import logging
+from xml.sax.saxutils import escape as xml_escape
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from lxml import etree
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Inches, Pt, RGBColor, Length
+from docx.table import _Cell
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls, nsmap
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.shape import CT_Inline
+
+try:
+    import pyvips
+except (ImportError, OSError):  # optional: shrink-on-load resize, Pillow used otherwise
+    pyvips = None
+
+try:
+    from PIL import Image
+except ImportError:  # photos are skipped with a warning
+    Image = None
+
+try:
+    import openpyxl
+except ImportError:  # TRS data table is left empty with a warning
+    openpyxl = None
+
+
+# Build progress is reported at INFO; build_report.py enables it for the CLI
+logger = logging.getLogger(__name__)
+
+
+# Photo resizes and plot file reads for all runs share this pool, so at most
+# cpu_count full-size photos are decoded at once. Only submit leaf tasks:
+# work that itself waits on this pool could deadlock it.
+_WORKERS = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+# Resized photos are cached here, keyed by source path, mtime, size and max_px.
+# Bump _PHOTO_CACHE_VERSION whenever the resize/encode settings change.
+# The first cache write in a process prunes least recently used entries down
+# to _PHOTO_CACHE_MAX_BYTES (cache hits refresh an entry's mtime).
+_PHOTO_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'test_report', 'resized')
+_PHOTO_CACHE_VERSION = 4
+_PHOTO_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_photo_cache_pruned = False
+_photo_cache_lock = threading.Lock()
+
+
+# JPEG start-of-frame markers (SOF0-SOF15, excluding DHT, JPG and DAC), and
+# the baseline/extended/progressive Huffman ones Word renders reliably
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_EMBEDDABLE_SOF = frozenset({0xC0, 0xC1, 0xC2})
+
+# Template body content removed by _clear_body (section properties are kept)
+_BODY_CLEAR_XPATH = etree.XPath('./w:p | ./w:tbl | ./w:sdt', namespaces={'w': nsmap['w']})
+
+# Body elements of the config-only sections (cover, summary, procedure,
+# appendix), keyed by section name and TestReportGenerator._section_key.
+# Lets repeated builds in one process copy them instead of rebuilding.
+_SECTION_CACHE = OrderedDict()
+_SECTION_CACHE_SIZE = 32
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -34,44 +101,354 @@ def _bold_run(para, text, size_pt=None):
     return run
 
 
-def _set_cell_bold(cell, bold=True):
-    for para in cell.paragraphs:
-        for run in para.runs:
-            run.bold = bold
+def _run_xml(text, bold=False):
+    """Return <w:r> XML equivalent to python-docx's run.text = text.
+
+    Tabs become <w:tab/> and line breaks <w:br/>, matching python-docx.
+    """
+    parts = ['<w:r><w:rPr><w:b/></w:rPr>' if bold else '<w:r>']
+    for chunk in re.split(r'(\t|\r|\n)', text):
+        if chunk == '\t':
+            parts.append('<w:tab/>')
+        elif chunk in ('\r', '\n'):
+            parts.append('<w:br/>')
+        elif chunk:
+            space = ' xml:space="preserve"' if chunk.strip() != chunk else ''
+            parts.append(f'<w:t{space}>{xml_escape(chunk)}</w:t>')
+    parts.append('</w:r>')
+    return ''.join(parts)
+
+
+def _set_cell_text(tc, text, bold=False):
+    """Replace a <w:tc>'s content with text in a single run.
+
+    Same XML as cell.text = text (plus bold), built from one parsed fragment.
+    """
+    tc.clear_content()
+    tc.append(parse_xml(f'<w:p {nsdecls("w")}>{_run_xml(text, bold)}</w:p>'))
 
 
 def _merge_header_row(table, row_idx, col_start, col_end, text, bold=True):
-    """Merge cells in a row from col_start to col_end and set text."""
-    row = table.rows[row_idx]
-    cell = row.cells[col_start]
-    for i in range(col_start + 1, col_end + 1):
-        cell = cell.merge(row.cells[i])
-    cell.text = text
-    if bold:
-        _set_cell_bold(cell)
-    return cell
+    """Merge cells in a row from col_start to col_end and set text.
+
+    Edits the row's <w:tc> elements directly, giving the same XML as
+    repeated cell.merge() calls: the first cell takes the combined
+    gridSpan and width, the others are removed.
+    """
+    tr = table._tbl.tr_lst[row_idx]
+    merged = []
+    grid_col = tr.grid_before
+    for tc in tr.tc_lst:
+        if col_start <= grid_col <= col_end:
+            merged.append(tc)
+        grid_col += tc.grid_span
+    first = merged[0]
+    widths = [tc.width for tc in merged]
+    if all(widths):
+        first.width = Length(sum(widths))
+    first.grid_span = sum(tc.grid_span for tc in merged)
+    for tc in merged[1:]:
+        tr.remove(tc)
+    _set_cell_text(first, text, bold)
+    return _Cell(first, table)
+
+
+def _levels_by_name(levels):
+    """Return {level name: level dict}; the first level wins for duplicate names."""
+    by_name = {}
+    for lv in levels:
+        by_name.setdefault(lv['name'], lv)
+    return by_name
+
+
+def _jpeg_dims(path):
+    """Return (width, height) from a JPEG's SOF header without decoding it, or None.
+
+    Also None for JPEGs the resize path should still re-encode: anything but
+    8-bit SOF0/SOF1/SOF2 frames (lossless, hierarchical, arithmetic-coded,
+    12-bit), CMYK/YCCK (not 1 or 3 components) and files with EXIF data,
+    whose orientation tag the resize path ignores.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read(2) != b'\xff\xd8':
+                return None
+            while True:
+                prefix, code = f.read(2)
+                if prefix != 0xFF:
+                    return None
+                while code == 0xFF:  # fill bytes before a marker
+                    code = f.read(1)[0]
+                if code == 0x01 or 0xD0 <= code <= 0xD7:  # markers without a length
+                    continue
+                (seg_len,) = struct.unpack('>H', f.read(2))
+                if code in _JPEG_SOF_MARKERS:
+                    if code not in _JPEG_EMBEDDABLE_SOF:
+                        return None
+                    precision, height, width, n_components = struct.unpack('>BHHB', f.read(6))
+                    if precision != 8 or n_components not in (1, 3):
+                        return None
+                    return width, height
+                if code == 0xDA:  # start of scan before any SOF: malformed
+                    return None
+                if code == 0xE1:  # APP1
+                    if f.read(4) == b'Exif':
+                        return None
+                    f.seek(seg_len - 6, 1)
+                else:
+                    f.seek(seg_len - 2, 1)
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+
+def _fits_unchanged(src_path, max_px):
+    """True if src_path is a JPEG no larger than max_px, embedded as-is."""
+    dims = _jpeg_dims(src_path)
+    return dims is not None and max(dims) <= max_px
+
+
+def _prune_photo_cache(max_bytes=None):
+    """Delete the least recently used cache entries until the total fits max_bytes.
+
+    Temporary files more than an hour old (left by interrupted writes) are
+    removed as well.
+    """
+    if max_bytes is None:
+        max_bytes = _PHOTO_CACHE_MAX_BYTES
+    stale_tmp_ns = time.time_ns() - 3600 * 10**9
+    entries = []
+    try:
+        with os.scandir(_PHOTO_CACHE_DIR) as it:
+            for e in it:
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                if e.name.endswith('.tmp'):
+                    if st.st_mtime_ns < stale_tmp_ns:
+                        entries.append((0, 0, e.path))  # sorts first, always removed
+                else:
+                    entries.append((st.st_mtime_ns, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    entries.sort()
+    for mtime_ns, size, path in entries:
+        if mtime_ns and total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _photo_cached(resize):
+    """Cache resize(src_path, max_px) results as JPEG files in _PHOTO_CACHE_DIR.
+
+    Cache read/write failures fall back to resizing; entries are written
+    atomically so concurrent resizes never see a partial file. Photos that
+    are already small enough (see _fits_unchanged) are returned as their
+    original bytes without calling resize or touching the cache.
+    """
+    @functools.wraps(resize)
+    def wrapper(src_path, max_px=900):
+        global _photo_cache_pruned
+        try:
+            st = os.stat(src_path)
+        except OSError:
+            return resize(src_path, max_px=max_px)
+        if _fits_unchanged(src_path, max_px):
+            # No decode or re-encode needed: embed the original bytes
+            try:
+                with open(src_path, 'rb') as f:
+                    return io.BytesIO(f.read())
+            except OSError as e:
+                logger.warning("  WARNING: could not read %s: %s", os.path.basename(src_path), e)
+                return None
+        key = hashlib.blake2b(
+            f'{_PHOTO_CACHE_VERSION}|{os.path.abspath(src_path)}|'
+            f'{st.st_mtime_ns}|{st.st_size}|{max_px}'.encode(),
+            digest_size=16).hexdigest()
+        cache_path = os.path.join(_PHOTO_CACHE_DIR, f'{key}.jpg')
+        try:
+            with open(cache_path, 'rb') as f:
+                buf = io.BytesIO(f.read())
+        except OSError:
+            pass
+        else:
+            try:
+                os.utime(cache_path)  # mark as recently used for pruning
+            except OSError:
+                pass
+            return buf
+
+        buf = resize(src_path, max_px=max_px)
+        if buf is not None:
+            try:
+                os.makedirs(_PHOTO_CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=_PHOTO_CACHE_DIR, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(buf.getvalue())
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
+            with _photo_cache_lock:
+                prune, _photo_cache_pruned = not _photo_cache_pruned, True
+            if prune:
+                _prune_photo_cache()
+        return buf
+    return wrapper
+
+
+def _scan_dir(directory, pred):
+    """Return sorted (name, path) pairs for the entries of directory accepted by pred.
+
+    pred receives each os.DirEntry; entries cache their name, path and file
+    type from the directory listing, so pred can call is_file() without an
+    extra stat. A missing or unreadable directory gives [].
+    """
+    if not directory:
+        return []
+    try:
+        with os.scandir(directory) as entries:
+            return sorted((e.name, e.path) for e in entries if pred(e))
+    except OSError:
+        return []
+
+
+@functools.lru_cache(maxsize=None)
+def _glob_re(pattern):
+    """Return the compiled regex for a glob pattern (compared against normcased names)."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _scan_pngs(directory, pattern='*.png'):
+    """Return sorted (name, path) pairs in directory matching pattern.
+
+    Same matches as glob.glob: names starting with '.' only match patterns
+    that start with '.'.
+    """
+    if pattern == '*.png':
+        def pred(e):
+            return os.path.normcase(e.name).endswith('.png') and not e.name.startswith('.')
+    else:
+        pattern_re = _glob_re(pattern)
+        hidden_ok = pattern.startswith('.')
+
+        def pred(e):
+            return ((hidden_ok or not e.name.startswith('.'))
+                    and pattern_re.match(os.path.normcase(e.name)) is not None)
+    return _scan_dir(directory, pred)
 
 
 def _sorted_pngs(directory, pattern='*.png'):
     """Return sorted list of PNG paths in directory matching pattern."""
-    if not directory or not os.path.isdir(directory):
-        return []
-    files = glob.glob(os.path.join(directory, pattern))
-    return sorted(files)
+    return [path for _, path in _scan_pngs(directory, pattern)]
+
 
+@functools.lru_cache(maxsize=None)
+def _substring_re(substrings):
+    """Return a compiled regex matching any of substrings (a tuple), or None if empty."""
+    if not substrings:
+        return None
+    return re.compile('|'.join(map(re.escape, substrings)))
 
-def _filter_plots(directory, include=None, exclude=None):
-    """Return sorted PNGs from directory, applying include/exclude substring filters."""
-    paths = _sorted_pngs(directory)
-    if include:
-        paths = [p for p in paths if any(s in os.path.basename(p) for s in include)]
-    if exclude:
-        paths = [p for p in paths if not any(s in os.path.basename(p) for s in exclude)]
-    return paths
+
+# Seismic run plot categories: bucket -> (include, exclude) name substrings.
+# A plot lands in every bucket whose filters it passes.
+_SEISMIC_PLOT_BUCKETS = {
+    # TRS plots: Table channel TRS + TRSall
+    'trs_plots': (('TRS', 'TRSvsRRS'), ('TH_', 'CC', 'CH')),
+    'th_plots':  (('TH_Table',), ()),
+    'cc_plots':  (('_CC', '_CH'), ()),
+    'uut_plots': ((), ('Table_', 'TRSvsRRS_All', '_CC', '_CH')),
+}
+
+
+def _scan_plots(directory, buckets):
+    """Sort the PNGs in directory into buckets in a single listing.
+
+    buckets maps a key to an (include, exclude) pair of substring tuples; an
+    empty include accepts every name. Returns key -> sorted list of paths.
+    """
+    filters = [(key, _substring_re(include), _substring_re(exclude))
+               for key, (include, exclude) in buckets.items()]
+    out = {key: [] for key in buckets}
+    for name, p in _scan_pngs(directory):
+        for key, include_re, exclude_re in filters:
+            if include_re and not include_re.search(name):
+                continue
+            if exclude_re and exclude_re.search(name):
+                continue
+            out[key].append(p)
+    return out
+
+
+@functools.lru_cache(maxsize=64)
+def _load_trs_excel(path, mtime_ns, size):
+    """Parse a TRS workbook into (rows, annotations).
+
+    mtime_ns and size are only part of the cache key, so an edited workbook
+    is read again. Callers must not modify the returned rows.
+    """
+    # Read-only mode streams the sheet XML without building Cell objects;
+    # everything needed is read in one pass from row 3, padded to col L
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    try:
+        sheet_rows = list(wb.active.iter_rows(min_row=3, max_col=12, values_only=True))
+    finally:
+        wb.close()  # read-only workbooks keep the zip file open
+
+    # Read annotations from row 3 and 4 (low resonance, cutoff)
+    row3, row4 = (sheet_rows + [(None,) * 12] * 2)[:2]
+    annotations = {
+        'low_resonance': row3[10],
+        'low_resonance_label': row3[11],
+        'cutoff': row4[10],
+        'cutoff_label': row4[11],
+    }
+
+    # Data starts at row 3 (row 1=direction headers, row 2=column headers)
+    # Columns: X(0-2), Y(3-5), Z(6-8)  → Freq, RRS, TRS for each direction
+    rows = []
+    for row in sheet_rows:
+        if row[0] is None:
+            continue
+        rows.append({
+            'freq_x': row[0], 'rrs_x': row[1], 'trs_x': row[2],
+            'freq_y': row[3], 'rrs_y': row[4], 'trs_y': row[5],
+            'freq_z': row[6], 'rrs_z': row[7], 'trs_z': row[8],
+        })
+    return rows, annotations
+
+
+def _read_bytes(path):
+    """Return the contents of path, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _sample_evenly(items, max_items):
+    """Return up to max_items evenly-spaced items, always including the first and last."""
+    if max_items is None or len(items) <= max_items:
+        return items
+    if max_items == 1:
+        return [items[len(items) // 2]]
+    # Evenly-spaced indices, always include first (0) and last (N-1). Same
+    # values as round(i * (N-1) / (M-1)): the integer product is exact, and
+    # rint rounds half to even like round(). (np.linspace computes i * step
+    # and can land on the other side of a .5.)
+    indices = np.unique(np.rint(np.arange(max_items) * (len(items) - 1) / (max_items - 1)).astype(np.intp))
+    return [items[i] for i in indices]
 
 
 def _select_photos(directory, max_photos=None,
-                   extensions=('.jpg', '.jpeg', '.JPG', '.JPEG', '.png', '.PNG')):
+                   extensions=('.jpg', '.jpeg', '.JPG', '.JPEG', '.png', '.PNG'),
+                   return_total=False):
     """Return a sorted list of photo paths from directory.
 
     If total count exceeds max_photos, returns an evenly-spaced sample that always
@@ -79,25 +456,16 @@ def _select_photos(directory, max_photos=None,
 
     Parameters
     ----------
-    directory  : str   Path to the photo directory.
-    max_photos : int   Maximum number of photos to return (None = unlimited).
-    extensions : tuple File extensions to include.
+    directory    : str   Path to the photo directory.
+    max_photos   : int   Maximum number of photos to return (None = unlimited).
+    extensions   : tuple File extensions to include (matched case-insensitively).
+    return_total : bool  If True, return (photos, total_count) from the same scan.
     """
-    if not directory or not os.path.isdir(directory):
-        return []
-    photos = sorted([
-        os.path.join(directory, f) for f in os.listdir(directory)
-        if os.path.splitext(f)[1] in extensions
-    ])
-    if not photos:
-        return []
-    if max_photos is None or len(photos) <= max_photos:
-        return photos
-    if max_photos == 1:
-        return [photos[len(photos) // 2]]
-    # Evenly-spaced indices, always include first (0) and last (N-1)
-    indices = {round(i * (len(photos) - 1) / (max_photos - 1)) for i in range(max_photos)}
-    return [photos[i] for i in sorted(indices)]
+    exts = frozenset(e.lower() for e in extensions)
+    photos = [path for _, path in _scan_dir(
+        directory, lambda e: os.path.splitext(e.name)[1].lower() in exts and e.is_file())]
+    selected = _sample_evenly(photos, max_photos)
+    return (selected, len(photos)) if return_total else selected
 
 
 # ── Generator ─────────────────────────────────────────────────────────────────
@@ -115,24 +483,35 @@ class TestReportGenerator:
             Merged project config (project_info + reports['test_report'] overrides).
         """
         self.cfg = resolved
+        self._levels_by_name = _levels_by_name(resolved.get('levels', []))
+        # Lowest natural frequency over all UUTs, quoted in every seismic run
+        self._lowest_nat_freq = min(
+            (min(u['nat_freq'].values()) for u in resolved.get('uuts', []) if u.get('nat_freq')),
+            default=None)
+        self._image_rels = {}        # image path -> (rId, Image), see _add_picture
+        self._next_shape_id = None   # running drawing id, see _add_picture
         template_path = resolved.get('template')
         if template_path and os.path.isfile(template_path):
             self.doc = Document(template_path)
             self._clear_body()
+            st = os.stat(template_path)
+            template_key = (os.path.abspath(template_path), st.st_mtime_ns, st.st_size)
         else:
-            print(f"WARNING: Template not found at '{template_path}'. Using blank document.")
+            logger.warning("WARNING: Template not found at '%s'. Using blank document.", template_path)
             self.doc = Document()
             self._setup_fallback_styles()
+            template_key = None
+        # Styles resolve against the template, so it is part of the section key
+        self._section_key = hashlib.blake2b(
+            repr((template_key, resolved)).encode(), digest_size=16).hexdigest()
 
     # ── Document setup ────────────────────────────────────────────────────────
 
     def _clear_body(self):
         """Remove all existing paragraphs and tables from the template body."""
         body = self.doc.element.body
-        for child in list(body):
-            tag = child.tag.split('}')[-1]
-            if tag in ('p', 'tbl', 'sdt'):
-                body.remove(child)
+        for child in _BODY_CLEAR_XPATH(body):
+            body.remove(child)
         # Keep section properties (page size / margins)
 
     def _setup_fallback_styles(self):
@@ -143,6 +522,33 @@ class TestReportGenerator:
             sec.top_margin    = Inches(1.3)
             sec.bottom_margin = Inches(1.2)
 
+    def _build_cached(self, name, build):
+        """Run build() to append a section, or append a copy of its cached output.
+
+        Only for sections that depend on nothing but the config and template
+        (no pictures or other relationships).
+        """
+        body = self.doc.element.body
+        key = (name, self._section_key)
+        cached = _SECTION_CACHE.get(key)
+        if cached is None:
+            # New content lands before the trailing sectPr, if there is one
+            start = len(body) - (body.sectPr is not None)
+            build()
+            end = len(body) - (body.sectPr is not None)
+            _SECTION_CACHE[key] = [copy.deepcopy(el) for el in body[start:end]]
+            if len(_SECTION_CACHE) > _SECTION_CACHE_SIZE:
+                _SECTION_CACHE.popitem(last=False)
+            return
+        _SECTION_CACHE.move_to_end(key)
+        sect_pr = body.sectPr
+        for el in cached:
+            el = copy.deepcopy(el)
+            if sect_pr is not None:
+                sect_pr.addprevious(el)
+            else:
+                body.append(el)
+
     # ── Paragraph helpers ─────────────────────────────────────────────────────
 
     def _p(self, text='', style='Normal'):
@@ -171,16 +577,49 @@ class TestReportGenerator:
 
     # ── Plot embedding ────────────────────────────────────────────────────────
 
-    def _embed_plot(self, png_path, centered=True):
-        """Embed a PNG plot inline at full width."""
-        if not png_path or not os.path.isfile(png_path):
+    def _add_picture(self, run, image_src, width, path=None):
+        """Append an inline picture to run; same result as run.add_picture().
+
+        python-docx looks up the image part and scans the whole document for
+        the next free drawing id on every picture. Here image parts are looked
+        up once per source path, and drawing ids come from a running counter
+        seeded from the document on first use (pictures are the only elements
+        this generator adds ids to).
+
+        When image_src is a stream already read from a file, pass that file as
+        path so the picture is cached and named as if it were added by path.
+        """
+        part = self.doc.part
+        key = image_src if isinstance(image_src, str) else path
+        rel = self._image_rels.get(key) if key else None
+        if rel is None:
+            rel = part.get_or_add_image(image_src)
+            if key:
+                self._image_rels[key] = rel
+        rId, image = rel
+        filename = os.path.basename(path) if path else image.filename
+        cx, cy = image.scaled_dimensions(width, None)
+        if self._next_shape_id is None:
+            self._next_shape_id = part.next_id
+        inline = CT_Inline.new_pic_inline(self._next_shape_id, rId, filename, cx, cy)
+        self._next_shape_id += 1
+        run._r.add_drawing(inline)
+
+    def _embed_plot(self, png_path, centered=True, data=None):
+        """Embed a PNG plot inline at full width.
+
+        data, if given, is the file's bytes read ahead of time (see _prepare_run).
+        """
+        if data is None and (not png_path or not os.path.isfile(png_path)):
             p = self._p(f'[Plot not found: {os.path.basename(png_path or "")}]')
             return p
         p = self.doc.add_paragraph()
         if centered:
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run()
-        run.add_picture(png_path, width=self.PLOT_WIDTH)
+        if data is None:
+            self._add_picture(p.add_run(), png_path, self.PLOT_WIDTH)
+        else:
+            self._add_picture(p.add_run(), io.BytesIO(data), self.PLOT_WIDTH, path=png_path)
         return p
 
     def _embed_plots(self, png_paths, plots_per_continuation=4, continuation_heading=None):
@@ -193,15 +632,37 @@ class TestReportGenerator:
     # ── Photo helpers ─────────────────────────────────────────────────────────
 
     @staticmethod
+    @_photo_cached
     def _resize_photo(src_path, max_px=900):
         """Return a BytesIO stream of the photo, resized to max_px on the longest side.
 
-        Keeps aspect ratio. Returns None on error. Caches nothing — caller embeds directly.
+        Keeps aspect ratio. Returns None on error. Results are cached on disk
+        (see _photo_cached), so unchanged photos are only resized once; photos
+        already within max_px are passed through by the cache wrapper.
+        Uses pyvips when installed: it decodes JPEGs directly at a reduced
+        scale instead of resampling the full-size image.
         """
+        if pyvips is not None:
+            try:
+                # no_rotate: ignore EXIF orientation, same as the Pillow path
+                img = pyvips.Image.thumbnail(src_path, max_px, height=max_px,
+                                             size='down', no_rotate=True)
+                if img.hasalpha():
+                    img = img.extract_band(0, n=img.bands - 1)
+                data = img.jpegsave_buffer(Q=80, subsample_mode='on', strip=True)
+                return io.BytesIO(data)
+            except Exception as e:
+                logger.warning("  WARNING: could not resize %s: %s", os.path.basename(src_path), e)
+                return None
+        if Image is None:
+            logger.warning("  WARNING: Pillow not installed — skipping %s", os.path.basename(src_path))
+            return None
         try:
-            from PIL import Image
-            import io
             img = Image.open(src_path)
+            # JPEG shrink-on-load: decode at the largest 1/2, 1/4 or 1/8 scale
+            # that still covers max_px, so LANCZOS runs on far fewer pixels
+            if img.format == 'JPEG':
+                img.draft('RGB', (max_px, max_px))
             # Convert to RGB if needed (e.g. CMYK or RGBA JPEGs)
             if img.mode not in ('RGB', 'L'):
                 img = img.convert('RGB')
@@ -212,13 +673,29 @@ class TestReportGenerator:
                 new_h = max(1, round(h * scale))
                 img = img.resize((new_w, new_h), Image.LANCZOS)
             buf = io.BytesIO()
-            img.save(buf, format='JPEG', quality=80, optimize=True)
+            # Single-pass encode with 4:2:0 chroma: the optimized-Huffman second
+            # pass saves only a few percent, and the .docx is zipped anyway
+            img.save(buf, format='JPEG', quality=80, subsampling=2)
             buf.seek(0)
             return buf
         except Exception as e:
-            print(f"  WARNING: could not resize {os.path.basename(src_path)}: {e}")
+            logger.warning("  WARNING: could not resize %s: %s", os.path.basename(src_path), e)
             return None
 
+    def _resize_photos(self, photos, max_px=900):
+        """Resize photos concurrently; returns buffers aligned with photos.
+
+        Entries that are None, missing, or fail to resize map to None. Pillow
+        releases the GIL while decoding, resampling and encoding, so a thread
+        pool (the shared _WORKERS) spreads the work across cores.
+        """
+        todo = [i for i, photo in enumerate(photos) if photo and os.path.isfile(photo)]
+        bufs = [None] * len(photos)
+        resized = _WORKERS.map(lambda i: self._resize_photo(photos[i], max_px=max_px), todo)
+        for i, buf in zip(todo, resized):
+            bufs[i] = buf
+        return bufs
+
     def _build_photo_grid(self, photos, cols=2, photo_width_in=3.0, max_px=900):
         """Embed photos in a cols-wide grid table.
 
@@ -243,50 +720,56 @@ class TestReportGenerator:
             padded += [None] * (cols - remainder)
         n_rows = len(padded) // cols
 
+        bufs = self._resize_photos(padded, max_px=max_px)
+
         t = self._add_table(n_rows, cols, style='Table Grid')
+        # Table.rows / row.cells rebuild proxies on every access: snapshot once
+        grid = [row.cells for row in t.rows]
         for ri in range(n_rows):
             for ci in range(cols):
-                photo = padded[ri * cols + ci]
-                cell = t.rows[ri].cells[ci]
-                if photo and os.path.isfile(photo):
-                    buf = self._resize_photo(photo, max_px=max_px)
-                    if buf:
-                        p = cell.paragraphs[0]
-                        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        p.add_run().add_picture(buf, width=photo_w)
+                buf = bufs[ri * cols + ci]
+                cell = grid[ri][ci]
+                if buf:
+                    p = cell.paragraphs[0]
+                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    self._add_picture(p.add_run(), buf, photo_w)
                 # else: leave cell empty
         return t
 
-    def _build_photo_section(self, heading_text, photos, section_label, cols=2, photo_width_in=3.0):
-        """Build a labelled photo section: H2 heading + header row + photo grid."""
+    def _build_photo_section(self, heading_text, photos, section_label, cols=2, photo_width_in=3.0,
+                             bufs=None):
+        """Build a labelled photo section: H2 heading + header row + photo grid.
+
+        bufs, if given, holds the already resized photos (aligned with photos).
+        """
         self._h2(heading_text)
         if not photos:
             self._p(f'[No {section_label} photos found]')
             return
         # Build table with a label header row above the photos
         photo_w = Inches(photo_width_in)
-        padded = list(photos)
-        remainder = len(padded) % cols
+        if bufs is None:
+            bufs = self._resize_photos(photos, max_px=900)
+        bufs = list(bufs)
+        remainder = len(bufs) % cols
         if remainder:
-            padded += [None] * (cols - remainder)
-        n_photo_rows = len(padded) // cols
+            bufs += [None] * (cols - remainder)
+        n_photo_rows = len(bufs) // cols
 
         t = self._add_table(1 + n_photo_rows, cols, style='Table Grid')
+        grid = [row.cells for row in t.rows]
         # Header row with section label in each cell
-        for ci in range(cols):
-            t.rows[0].cells[ci].text = section_label
-            _set_cell_bold(t.rows[0].cells[ci])
+        for cell in grid[0]:
+            _set_cell_text(cell._tc, section_label, bold=True)
 
         for ri in range(n_photo_rows):
             for ci in range(cols):
-                photo = padded[ri * cols + ci]
-                cell = t.rows[1 + ri].cells[ci]
-                if photo and os.path.isfile(photo):
-                    buf = self._resize_photo(photo, max_px=900)
-                    if buf:
-                        p = cell.paragraphs[0]
-                        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        p.add_run().add_picture(buf, width=photo_w)
+                buf = bufs[ri * cols + ci]
+                cell = grid[1 + ri][ci]
+                if buf:
+                    p = cell.paragraphs[0]
+                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    self._add_picture(p.add_run(), buf, photo_w)
 
     # ── Table helpers ─────────────────────────────────────────────────────────
 
@@ -295,53 +778,39 @@ class TestReportGenerator:
         t.style = style
         return t
 
-    def _set_row_bold(self, row):
-        for cell in row.cells:
-            _set_cell_bold(cell)
+    def _add_text_table(self, rows, header_rows=1, style='Table Grid'):
+        """Add a table of plain-text cells, built as one XML fragment.
 
-    def _fill_row(self, row, values, bold=False):
-        for cell, val in zip(row.cells, values):
-            cell.text = str(val)
-            if bold:
-                _set_cell_bold(cell)
+        Each value is written as str(value) in a single run; the first
+        header_rows rows are bold. Equivalent to setting cell.text on every
+        cell, without python-docx's per-row and per-cell lookups.
+        """
+        t = self._add_table(0, len(rows[0]), style=style)
+        tcs = [f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{gc.w.twips}"/></w:tcPr><w:p>'
+               for gc in t._tbl.tblGrid.gridCol_lst]
+        trs = []
+        for i, values in enumerate(rows):
+            bold = i < header_rows
+            cells = ''.join(f'{tc}{_run_xml(str(val), bold)}</w:p></w:tc>'
+                            for tc, val in zip(tcs, values))
+            trs.append(f'<w:tr>{cells}</w:tr>')
+        t._tbl.extend(list(parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(trs)}</w:tbl>')))
+        return t
 
     # ── TRS Excel reader ──────────────────────────────────────────────────────
 
     def _read_trs_excel(self, excel_path):
         """Read TRS table from Excel. Returns list of row dicts."""
-        try:
-            import openpyxl
-        except ImportError:
-            print("WARNING: openpyxl not installed — TRS table will be empty.")
+        if openpyxl is None:
+            logger.warning("WARNING: openpyxl not installed — TRS table will be empty.")
             return [], {}
 
         if not excel_path or not os.path.isfile(excel_path):
-            print(f"WARNING: TRS Excel not found: {excel_path}")
+            logger.warning("WARNING: TRS Excel not found: %s", excel_path)
             return [], {}
 
-        wb = openpyxl.load_workbook(excel_path, data_only=True)
-        ws = wb.active
-
-        # Read annotations from row 3 and 4 (low resonance, cutoff)
-        annotations = {
-            'low_resonance': ws.cell(3, 11).value,
-            'low_resonance_label': ws.cell(3, 12).value,
-            'cutoff': ws.cell(4, 11).value,
-            'cutoff_label': ws.cell(4, 12).value,
-        }
-
-        # Data starts at row 3 (row 1=direction headers, row 2=column headers)
-        # Columns: X(0-2), Y(3-5), Z(6-8)  → Freq, RRS, TRS for each direction
-        rows = []
-        for row in ws.iter_rows(min_row=3, values_only=True):
-            if row[0] is None:
-                continue
-            rows.append({
-                'freq_x': row[0], 'rrs_x': row[1], 'trs_x': row[2],
-                'freq_y': row[3], 'rrs_y': row[4], 'trs_y': row[5],
-                'freq_z': row[6], 'rrs_z': row[7], 'trs_z': row[8],
-            })
-        return rows, annotations
+        st = os.stat(excel_path)
+        return _load_trs_excel(os.path.abspath(excel_path), st.st_mtime_ns, st.st_size)
 
     def _build_trs_table(self, data_rows):
         """Build the Response Spectra Data table (3 direction groups × 3 cols)."""
@@ -349,69 +818,61 @@ class TestReportGenerator:
             self._p('[TRS data not available]')
             return
 
-        n_data = len(data_rows)
-        # 2 header rows + data rows
-        t = self._add_table(2 + n_data, 9)
-
-        # Row 0: direction headers (merged 3 cols each)
-        _merge_header_row(t, 0, 0, 2, 'X Direction', bold=True)
-        _merge_header_row(t, 0, 3, 5, 'Y Direction', bold=True)
-        _merge_header_row(t, 0, 6, 8, 'Z Direction', bold=True)
+        def _fmt(v):
+            if v is None:
+                return ''
+            try:
+                return f'{float(v):.2f}'
+            except (TypeError, ValueError):
+                return str(v)
 
-        # Row 1: column headers
+        # Row 0: direction headers (merged below), row 1: column headers
         col_headers = [
             'Freq.\n(Hz)', 'RRS\n(g)', 'TRS\n(g)',
             'Freq.\n(Hz)', 'RRS\n(g)', 'TRS\n(g)',
             'Freq.\n(Hz)', 'RRS\n(g)', 'TRS\n(g)',
         ]
-        self._fill_row(t.rows[1], col_headers, bold=True)
+        table_rows = [[''] * 9, col_headers]
 
         # Data rows
-        for i, row in enumerate(data_rows):
-            def _fmt(v):
-                if v is None:
-                    return ''
-                try:
-                    return f'{float(v):.2f}'
-                except (TypeError, ValueError):
-                    return str(v)
-
-            vals = [
+        for row in data_rows:
+            table_rows.append([
                 _fmt(row['freq_x']), _fmt(row['rrs_x']), _fmt(row['trs_x']),
                 _fmt(row['freq_y']), _fmt(row['rrs_y']), _fmt(row['trs_y']),
                 _fmt(row['freq_z']), _fmt(row['rrs_z']), _fmt(row['trs_z']),
-            ]
-            self._fill_row(t.rows[2 + i], vals)
+            ])
+        t = self._add_text_table(table_rows, header_rows=2)
+
+        # Row 0: direction headers (merged 3 cols each)
+        _merge_header_row(t, 0, 0, 2, 'X Direction', bold=True)
+        _merge_header_row(t, 0, 3, 5, 'Y Direction', bold=True)
+        _merge_header_row(t, 0, 6, 8, 'Z Direction', bold=True)
 
     def _build_levels_table(self, levels):
         """Seismic levels table (10 cols, 2 data rows per level: z/h=1 and z/h=0).
         Reused in Test Results Summary and at the start of each Run section.
         """
-        n_data_rows = len(levels) * 2
-        t = self._add_table(1 + n_data_rows, 10)
-        self._fill_row(t.rows[0],
+        table_rows = [
             ['Level', 'SDS (g)', 'z/h', 'Hf / Rμ',
              'AFLX-H (g)', 'ARIG-H (g)', 'AFLX-V (g)', 'ARIG-V (g)',
              '0.9·ARIG-H', '0.9·ARIG-V'],
-            bold=True)
-        row_idx = 1
+        ]
         for lv in levels:
             hf_rmu_zh1 = f"{lv['Hf']} / {lv['Rmu']}"
             hf_rmu_zh0 = f"{lv.get('Hf_zh0', 1.0)} / {lv.get('Rmu_zh0', 1.0)}"
-            self._fill_row(t.rows[row_idx], [
+            table_rows.append([
                 lv['name'], f"{lv['Sds_zh1']:.2f}", '1', hf_rmu_zh1,
                 f"{lv['Aflx_h']:.2f}", f"{lv['Arig_h']:.2f}",
                 f"{lv['Aflx_v']:.2f}", f"{lv['Arig_v']:.2f}",
                 f"{lv['Arig_h_90']:.2f}", f"{lv['Arig_v_90']:.2f}",
             ])
-            self._fill_row(t.rows[row_idx + 1], [
+            table_rows.append([
                 lv['name'], f"{lv['Sds_zh0']:.2f}", '0', hf_rmu_zh0,
                 f"{lv['Aflx_h']:.2f}", f"{lv['Arig_h']:.2f}",
                 f"{lv['Aflx_v']:.2f}", f"{lv['Arig_v']:.2f}",
                 f"{lv['Arig_h_90']:.2f}", f"{lv['Arig_v_90']:.2f}",
             ])
-            row_idx += 2
-        return t
+        return self._add_text_table(table_rows)
 
     def _build_run_results_table(self, runs, levels):
         """Peak acceleration results table for a list of runs.
@@ -419,29 +880,28 @@ class TestReportGenerator:
         """
         has_diag = any(r.get('has_diagonal', False) for r in runs)
         n_accel_cols = 4 if has_diag else 3
-        n_cols = 5 + n_accel_cols
         accel_header = ['X', 'Y', '45', 'Z'] if has_diag else ['X', 'Y', 'Z']
 
-        t = self._add_table(2 + len(runs), n_cols)
-        row0_vals = (['Test Run', 'Test Date', 'Level', '0.9·ARIG-H', '0.9·ARIG-V']
-                     + ['Peak Table Accel. (g)'] * n_accel_cols)
-        self._fill_row(t.rows[0], row0_vals, bold=True)
-        _merge_header_row(t, 0, 5, 4 + n_accel_cols, 'Peak Table Accel. (g)', bold=True)
-        self._fill_row(t.rows[1],
+        table_rows = [
+            (['Test Run', 'Test Date', 'Level', '0.9·ARIG-H', '0.9·ARIG-V']
+             + ['Peak Table Accel. (g)'] * n_accel_cols),
             ['Test Run', 'Test Date', 'Level', '0.9·ARIG-H', '0.9·ARIG-V'] + accel_header,
-            bold=True)
-        for i, run in enumerate(runs):
+        ]
+        levels_by_name = _levels_by_name(levels)
+        for run in runs:
             lv_name = run.get('level', '')
-            lv = next((l for l in levels if l['name'] == lv_name), {})
+            lv = levels_by_name.get(lv_name, {})
             pa = run.get('peak_accel', {})
             accel_vals = [str(pa.get('X', '')), str(pa.get('Y', ''))]
             if has_diag:
                 accel_vals.append(str(pa.get('D45', '')))
             accel_vals.append(str(pa.get('Z', '')))
-            self._fill_row(t.rows[2 + i], [
+            table_rows.append([
                 run.get('name', ''), run.get('date', ''), lv_name,
                 f"{lv.get('Arig_h_90', '')}", f"{lv.get('Arig_v_90', '')}",
             ] + accel_vals)
+        t = self._add_text_table(table_rows, header_rows=2)
+        _merge_header_row(t, 0, 5, 4 + n_accel_cols, 'Peak Table Accel. (g)', bold=True)
         return t
 
     # ═════════════════════════════════════════════════════════════════════════
@@ -461,21 +921,18 @@ class TestReportGenerator:
         self._p(cfg.get('subtitle', ''), style='Subtitle')
 
         # Manufacturer / Testing Laboratory 2-col table — no section header, appears first
-        t = self._add_table(2, 2)
-        t.rows[0].cells[0].text = 'Manufacturer'
-        t.rows[0].cells[1].text = 'Testing Laboratory'
-        self._set_row_bold(t.rows[0])
-        t.rows[1].cells[0].text = (
-            f"{mfr.get('company', '')}\n"
-            f"{mfr.get('address', '')}\n"
-            f"Contact: {mfr.get('contact', '')}"
-        )
-        t.rows[1].cells[1].text = (
-            f"{lab.get('name', '')}\n"
-            f"{lab.get('address', '')}\n"
-            f"Contact: {lab.get('contact', '')}\n"
-            f"Table: {lab.get('table_short', '')}"
-        )
+        self._add_text_table([
+            ['Manufacturer', 'Testing Laboratory'],
+            [
+                f"{mfr.get('company', '')}\n"
+                f"{mfr.get('address', '')}\n"
+                f"Contact: {mfr.get('contact', '')}",
+                f"{lab.get('name', '')}\n"
+                f"{lab.get('address', '')}\n"
+                f"Contact: {lab.get('contact', '')}\n"
+                f"Table: {lab.get('table_short', '')}",
+            ],
+        ])
 
         # Testing Scope
         self._cover_header('Testing Scope')
@@ -486,22 +943,20 @@ class TestReportGenerator:
 
         # Test Units — UUT dimensions / weight table
         self._cover_header('Test Units')
-        t = self._add_table(2 + len(uuts), 7)
-        self._fill_row(t.rows[0],
+        table_rows = [
             ['UUT', 'Model / Description', 'Mounting', 'Dimensions (in)', '', '', 'Weight\n(lb)'],
-            bold=True)
-        _merge_header_row(t, 0, 3, 5, 'Dimensions (in)', bold=True)
-        self._fill_row(t.rows[1],
             ['UUT', 'Model / Description', 'Mounting', 'Depth', 'Width', 'Height', 'Weight\n(lb)'],
-            bold=True)
-        for i, u in enumerate(uuts):
+        ]
+        for u in uuts:
             w = u.get('weight', '')
             w_str = f'{int(w):,}' if w != '' else ''
-            self._fill_row(t.rows[2 + i], [
+            table_rows.append([
                 str(u['number']), u['model'], u.get('mounting', ''),
                 str(u.get('depth', '')), str(u.get('width', '')), str(u.get('height', '')),
                 w_str,
             ])
+        t = self._add_text_table(table_rows, header_rows=2)
+        _merge_header_row(t, 0, 3, 5, 'Dimensions (in)', bold=True)
 
         # Certification company
         self._blank()
@@ -515,10 +970,9 @@ class TestReportGenerator:
         # Revision history
         self._cover_header('REVISION HISTORY')
         revisions = cfg.get('revision_history', [])
-        t = self._add_table(1 + len(revisions), 3)
-        self._fill_row(t.rows[0], ['Revision', 'Date', 'Revision Description'], bold=True)
-        for i, rev in enumerate(revisions):
-            self._fill_row(t.rows[1 + i], [rev.get('rev',''), rev.get('date',''), rev.get('description','')])
+        self._add_text_table(
+            [['Revision', 'Date', 'Revision Description']]
+            + [[rev.get('rev',''), rev.get('date',''), rev.get('description','')] for rev in revisions])
 
     def _build_test_results_summary(self):
         cfg    = self.cfg
@@ -534,21 +988,19 @@ class TestReportGenerator:
             self._p(f"Level {lv['name']}: SDS={lv['Sds_zh1']:.2f}g (z/h=1); SDS={lv['Sds_zh0']:.2f}g (z/h=0)")
 
         # ── Resonance results table (first in section, matching reference) ────
-        t = self._add_table(2 + len(uuts), 7)
-        self._fill_row(t.rows[0],
+        table_rows = [
             ['UUT', 'Test Date', 'Level', 'Result', 'Resonant Freq. (Hz)', '', ''],
-            bold=True)
-        _merge_header_row(t, 0, 4, 6, 'Resonant Freq. (Hz)', bold=True)
-        self._fill_row(t.rows[1],
             ['UUT', 'Test Date', 'Level', 'Result', 'F-B', 'S-S', 'V'],
-            bold=True)
-        for i, u in enumerate(uuts):
+        ]
+        for u in uuts:
             nf = u.get('nat_freq', {})
-            self._fill_row(t.rows[2 + i], [
+            table_rows.append([
                 str(u['number']), u.get('test_date', ''), u.get('level', ''),
                 u.get('result', ''),
                 str(nf.get('fb', '')), str(nf.get('ss', '')), str(nf.get('v', '')),
             ])
+        t = self._add_text_table(table_rows, header_rows=2)
+        _merge_header_row(t, 0, 4, 6, 'Resonant Freq. (Hz)', bold=True)
 
         # "As shown below" + run results table
         self._no_space(
@@ -637,23 +1089,23 @@ class TestReportGenerator:
         # ── Lab equipment / calibration table (end of Test Procedure) ─────────
         equip = cfg.get('lab_equipment', [])
         if equip:
-            t = self._add_table(1 + len(equip), 8)
-            self._fill_row(t.rows[0],
+            table_rows = [
                 ['Lab ID', 'Ch.', 'Description', 'Manufacturer', 'Model', 'Serial', 'Cal. Date', 'Cal. Due'],
-                bold=True)
-            for i, eq in enumerate(equip):
-                self._fill_row(t.rows[1 + i], [
+            ]
+            for eq in equip:
+                table_rows.append([
                     eq.get('lab_id', ''), eq.get('ch', ''), eq.get('description', ''),
                     eq.get('manufacturer', ''), eq.get('model', ''), eq.get('serial', ''),
                     eq.get('cal_date', ''), eq.get('cal_due', ''),
                 ])
+            self._add_text_table(table_rows)
 
     def _build_uut_summary(self, uut):
         cfg = self.cfg
         n   = uut['number']
         nf  = uut.get('nat_freq', {})
         lvs = cfg.get('levels', [])
-        lv  = next((l for l in lvs if l['name'] == uut.get('level', '1')), lvs[0] if lvs else {})
+        lv  = self._levels_by_name.get(uut.get('level', '1'), lvs[0] if lvs else {})
 
         self._h1(f"UUT Summary \u2013 UUT {n}")
 
@@ -699,17 +1151,45 @@ class TestReportGenerator:
         if not res_plots:
             self._p(f'[No resonance plots found in: {res_dir}]')
 
-    def _build_seismic_run(self, run):
+    def _prepare_run(self, run):
+        """Gather a seismic run's inputs: plot lists, resized photos and TRS rows.
+
+        Touches no document state, so generate() prepares the runs, one after
+        another, on a background thread while the earlier sections are built.
+        """
+        name = run.get('name', 'Run')
+        run_plots_cfg = self.cfg.get('run_plots', {}).get(name, {})
+        seismic_dir   = run_plots_cfg.get('seismic_dir')
+
+        prepared = {'seismic_dir': seismic_dir}
+        for key in ('pre_test_photos', 'post_test_photos'):
+            photo_cfg = run_plots_cfg.get(key, {})
+            photo_dir = photo_cfg.get('dir') if isinstance(photo_cfg, dict) else photo_cfg
+            photo_max = photo_cfg.get('max') if isinstance(photo_cfg, dict) else None
+            photos, total = (_select_photos(photo_dir, max_photos=photo_max, return_total=True)
+                             if photo_dir else ([], 0))
+            prepared[key] = (photo_dir, photos, total, self._resize_photos(photos, max_px=900))
+
+        prepared['trs_data'] = self._read_trs_excel(run_plots_cfg.get('trs_excel'))
+
+        prepared.update(_scan_plots(seismic_dir, _SEISMIC_PLOT_BUCKETS))
+
+        # Plot files are read here so _build_seismic_run only inserts them
+        plots = sorted({p for key in _SEISMIC_PLOT_BUCKETS for p in prepared[key]})
+        prepared['plot_data'] = dict(zip(plots, _WORKERS.map(_read_bytes, plots)))
+        return prepared
+
+    def _build_seismic_run(self, run, prepared=None):
         cfg    = self.cfg
         levels = cfg.get('levels', [])
+        standard = cfg.get('test_standard', '')
         name   = run.get('name', 'Run')
         lv_name = run.get('level', '')
-        lv = next((l for l in levels if l['name'] == lv_name), {})
 
-        # Get paths from resolved config
-        run_plots_cfg = cfg.get('run_plots', {}).get(name, {})
-        seismic_dir   = run_plots_cfg.get('seismic_dir')
-        trs_excel     = run_plots_cfg.get('trs_excel')
+        if prepared is None:
+            prepared = self._prepare_run(run)
+        seismic_dir = prepared['seismic_dir']
+        plot_data = prepared['plot_data']
 
         self._h1(f"Seismic Run - {name}")
         self._no_space(
@@ -726,96 +1206,78 @@ class TestReportGenerator:
         self._blank()
 
         # ── Pre-Test Pictures ─────────────────────────────────────────────────
-        pre_cfg   = run_plots_cfg.get('pre_test_photos', {})
-        pre_dir   = pre_cfg.get('dir') if isinstance(pre_cfg, dict) else pre_cfg
-        pre_max   = pre_cfg.get('max') if isinstance(pre_cfg, dict) else None
-        pre_photos = _select_photos(pre_dir, max_photos=pre_max) if pre_dir else []
+        pre_dir, pre_photos, total_pre, pre_bufs = prepared['pre_test_photos']
         if pre_dir:
-            total_pre = len(_select_photos(pre_dir))
-            print(f"  Embedding {len(pre_photos)} pre-test photos (of {total_pre} total)")
+            logger.info('  Embedding %d pre-test photos (of %d total)', len(pre_photos), total_pre)
         self._build_photo_section(
-            f"Pre-Test Pictures ({name})", pre_photos, 'Pre-test',
+            f"Pre-Test Pictures ({name})", pre_photos, 'Pre-test', bufs=pre_bufs,
         )
 
         # ── Post-Test Pictures ────────────────────────────────────────────────
-        post_cfg   = run_plots_cfg.get('post_test_photos', {})
-        post_dir   = post_cfg.get('dir') if isinstance(post_cfg, dict) else post_cfg
-        post_max   = post_cfg.get('max') if isinstance(post_cfg, dict) else None
-        post_photos = _select_photos(post_dir, max_photos=post_max) if post_dir else []
+        post_dir, post_photos, total_post, post_bufs = prepared['post_test_photos']
         if post_dir:
-            total_post = len(_select_photos(post_dir))
-            print(f"  Embedding {len(post_photos)} post-test photos (of {total_post} total)")
+            logger.info('  Embedding %d post-test photos (of %d total)', len(post_photos), total_post)
         self._build_photo_section(
-            f"Post-Test Pictures ({name})", post_photos, 'Post-test',
+            f"Post-Test Pictures ({name})", post_photos, 'Post-test', bufs=post_bufs,
         )
 
         # ── Response Spectra Plots ────────────────────────────────────────────
         self._h2(f"Response Spectra Plots ({name})")
-        # TRS plots: Table channel TRS + TRSall
-        trs_plots = _filter_plots(
-            seismic_dir,
-            include=['TRS', 'TRSvsRRS'],
-            exclude=['TH_', 'CC', 'CH'],
-        )
+        trs_plots = prepared['trs_plots']
         if trs_plots:
             for p in trs_plots:
-                self._embed_plot(p)
+                self._embed_plot(p, data=plot_data.get(p))
         else:
             self._p(f'[No TRS plots found in: {seismic_dir}]')
 
         # ── Response Spectra Data (TRS table from Excel) ──────────────────────
         self._h2(f"Response Spectra Data ({name})")
         # Lowest resonance note — wording matches reference
-        uuts_list = cfg.get('uuts', [])
-        all_nat = [min(u.get('nat_freq', {}).values()) for u in uuts_list if u.get('nat_freq')]
-        if all_nat:
-            low_res = min(all_nat)
+        low_res = self._lowest_nat_freq
+        if low_res is not None:
             self._p(
                 f"As is shown in the \u201cResonant Frequency Search Plots\u201d section of the UUT Summary, "
                 f"the lowest resonant frequency is {low_res:.1f} Hz. The low cutoff frequency is "
                 f"determined from the resonance search."
             )
-        trs_rows, trs_annotations = self._read_trs_excel(trs_excel)
+        trs_rows, trs_annotations = prepared['trs_data']
         self._build_trs_table(trs_rows)
 
         # ── Acceleration Time History Plots ───────────────────────────────────
         self._h2(f"Acceleration Time History Plots ({name})")
         self._p(
-            f"Per {cfg.get('test_standard', '')} Section 6.5.4.2.3, the peak shake table "
+            f"Per {standard} Section 6.5.4.2.3, the peak shake table "
             f"acceleration shall equal or exceed 90 percent of ARIG in each orthogonal direction."
         )
         # Run results table immediately after intro text (per reference structure)
         self._build_run_results_table([run], levels)
 
-        th_plots = _filter_plots(seismic_dir, include=['TH_Table'])
+        th_plots = prepared['th_plots']
         for p in th_plots:
-            self._embed_plot(p)
+            self._embed_plot(p, data=plot_data.get(p))
         if not th_plots:
             self._p(f'[No Table TH plots found in: {seismic_dir}]')
 
         # ── Statistical Independence Plots ────────────────────────────────────
         self._h2(f"Statistical Independence Plots ({name})")
         self._p(
-            f"Per {cfg.get('test_standard', '')} Section 5.2.2.7.3, simultaneous shake table "
+            f"Per {standard} Section 5.2.2.7.3, simultaneous shake table "
             f"motion in three orthogonal directions must be statistically independent."
         )
-        cc_plots = _filter_plots(seismic_dir, include=['_CC', '_CH'])
+        cc_plots = prepared['cc_plots']
         for p in cc_plots:
-            self._embed_plot(p)
+            self._embed_plot(p, data=plot_data.get(p))
         if not cc_plots:
             self._p(f'[No CC/CH plots found in: {seismic_dir}]')
 
         # ── Unit Accelerometer Plots ──────────────────────────────────────────
         self._h2(f"Unit Accelerometer Plots ({name})")
-        uut_plots = _filter_plots(
-            seismic_dir,
-            exclude=['Table_', 'TRSvsRRS_All', '_CC', '_CH'],
-        )
+        uut_plots = prepared['uut_plots']
         plots_per_continuation = 4
         for i, path in enumerate(uut_plots):
             if i > 0 and i % plots_per_continuation == 0:
                 self._h2(f"Unit Accelerometer Plots ({name}) (continued)")
-            self._embed_plot(path)
+            self._embed_plot(path, data=plot_data.get(path))
         if not uut_plots:
             self._p(f'[No UUT accelerometer plots found in: {seismic_dir}]')
 
@@ -845,30 +1307,47 @@ class TestReportGenerator:
         str
             Absolute path of the saved file.
         """
-        print("Building cover page...")
-        self._build_cover()
-
-        print("Building Test Results Summary...")
-        self.doc.add_page_break()
-        self._build_test_results_summary()
+        # Seismic run inputs (photo resizing, TRS workbooks, plot scans) are
+        # prepared on one background thread while the main thread builds the
+        # document: run 1 during the earlier sections, and run i+1 while run
+        # i is built. At most two runs' images are held at once; the fan-out
+        # inside each run is bounded by _WORKERS.
+        runs = self.cfg.get('runs', [])
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = pool.submit(self._prepare_run, runs[0]) if runs else None
 
-        print("Building Test Procedure...")
-        self.doc.add_page_break()
-        self._build_test_procedure()
+            logger.info('Building cover page...')
+            self._build_cached('cover', self._build_cover)
 
-        for uut in self.cfg.get('uuts', []):
-            print(f"Building UUT Summary – UUT {uut['number']}...")
+            logger.info('Building Test Results Summary...')
             self.doc.add_page_break()
-            self._build_uut_summary(uut)
+            self._build_cached('test_results_summary', self._build_test_results_summary)
 
-        for run in self.cfg.get('runs', []):
-            print(f"Building Seismic Run – {run.get('name', '')}...")
+            logger.info('Building Test Procedure...')
             self.doc.add_page_break()
-            self._build_seismic_run(run)
-
-        print("Building Appendix...")
+            self._build_cached('test_procedure', self._build_test_procedure)
+
+            for uut in self.cfg.get('uuts', []):
+                logger.info('Building UUT Summary – UUT %s...', uut['number'])
+                self.doc.add_page_break()
+                self._build_uut_summary(uut)
+
+            for i, run in enumerate(runs):
+                prepared = pending.result()
+                pending = (pool.submit(self._prepare_run, runs[i + 1])
+                           if i + 1 < len(runs) else None)
+                logger.info('Building Seismic Run – %s...', run.get('name', ''))
+                self.doc.add_page_break()
+                self._build_seismic_run(run, prepared)
+                del prepared  # python-docx holds its own copy of the images
+        finally:
+            # On an error, don't wait for a queued run to be prepared
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        logger.info('Building Appendix...')
         self.doc.add_page_break()
-        self._build_appendix()
+        self._build_cached('appendix', self._build_appendix)
 
         output_path = os.path.abspath(output_path)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -8,13 +8,21 @@ Usage:
 import argparse
 import os
 import numpy as np
-import yaml
 import pandas as pd
 
-from functions.parse_csv import parse_resonance_csv
+from functions._csv_cache import cached_parse_resonance_csv
 from functions.plot_transfer import plot_transfer
-from functions.save_plot import save_plot
+from functions.save_plot import save_plot, wait_for_writes
 from functions.plot_style import setup_plot_style
+from functions.save_trimmed import save_trimmed
+from functions.load_config import load_config
+
+
+# Table axis -> UUT axis label, by which UUT axis the table X axis drives
+_AXIS_MAPS = {
+    'FB': {'X': 'FB', 'Y': 'SS', 'Z': 'V'},
+    'SS': {'X': 'SS', 'Y': 'FB', 'Z': 'V'},
+}
 
 
 def main():
@@ -23,8 +31,7 @@ def main():
     args = parser.parse_args()
 
     # Load config
-    with open(args.config, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(args.config)
 
     # Configure plot style (font fallback, rcParams)
     setup_plot_style(config.get('plot', {}).get('font_name'))
@@ -43,26 +50,36 @@ def main():
     script_dir = config.get('script_dir', os.path.dirname(args.config))
 
     if plot_only:
-        # Parse each axis file and combine into single DataFrame
-        all_data = {}
+        # Parse each axis file and combine into single DataFrame. Axes that
+        # share a file are parsed together with the union of their mappings.
+        file_mappings = {}
         for axis in axes:
-            filepath = config['files'][axis]
-            axis_mapping = column_mapping.get(axis, {})
+            file_mappings.setdefault(config['files'][axis], {}).update(
+                column_mapping.get(axis, {}))
 
-            axis_df = parse_resonance_csv(
+        axis_dfs = []
+        for filepath, file_mapping in file_mappings.items():
+            axis_df = cached_parse_resonance_csv(
                 filepath=filepath,
-                column_mapping=axis_mapping,
+                column_mapping=file_mapping,
                 high_cutoff=high_cutoff,
             )
+            if not axis_dfs:
+                axis_dfs.append(axis_df)
+                continue
+            # Every file must share the first file's frequency grid; only
+            # the first file's Frequency column is kept
+            first_freq = axis_dfs[0]['Frequency'].to_numpy()
+            freq = axis_df['Frequency'].to_numpy()
+            if len(freq) != len(first_freq) or not np.allclose(freq, first_freq):
+                raise ValueError(
+                    f"Frequency points in {filepath} ({len(freq)} rows) do not match "
+                    f"{config['files'][axes[0]]} ({len(first_freq)} rows)"
+                )
+            axis_dfs.append(axis_df.drop(columns='Frequency'))
 
-            if 'Frequency' not in all_data:
-                all_data['Frequency'] = axis_df['Frequency'].values
-
-            for col in axis_df.columns:
-                if col != 'Frequency':
-                    all_data[col] = axis_df[col].values
-
-        resonance_data = pd.DataFrame(all_data)
+        # All frames carry the same 0..n-1 index, so concat lines up rows
+        resonance_data = pd.concat(axis_dfs, axis=1)
 
         # Reorder columns to match MATLAB: grouped by sensor, interleaved axes
         # Order: Frequency, Table_X/Y/Z, UUT_1_Controller_X/Y/Z, ...
@@ -83,11 +100,11 @@ def main():
         resonance_data = resonance_data[desired_order]
     else:
         # Process transfer function from time-domain data
-        from functions.parse_csv import parse_seismic_csv
+        from functions._csv_cache import cached_parse_seismic_csv
         from functions.process_transfer_function import process_transfer_function
 
         # For non-plot-only mode, parse time-domain CSV and compute transfer functions
-        trimmed_data = parse_seismic_csv(
+        trimmed_data = cached_parse_seismic_csv(
             filepath=config['files'],
             column_mapping=column_mapping,
             time_unit=config.get('time_unit', 'ms'),
@@ -95,10 +112,10 @@ def main():
         )
         resonance_data = process_transfer_function(axes, accels_config, trimmed_data)
 
-    # Save trimmed resonance data
-    trimmed_csv = os.path.join(script_dir, f'{run_name}_resonance_trimmed.csv')
-    resonance_data.to_csv(trimmed_csv, index=False)
-    print(f'Resonance data saved to {trimmed_csv}')
+    # Save trimmed resonance data (CSV unless output_format: parquet)
+    trimmed_path = save_trimmed(resonance_data, script_dir, f'{run_name}_resonance_trimmed',
+                                config.get('output_format', 'csv'))
+    print(f'Resonance data saved to {trimmed_path}')
 
     # Get unique UUTs
     uuts = list(dict.fromkeys(a['uut'] for a in accels_config))
@@ -106,6 +123,10 @@ def main():
     # Global plot counter across all UUTs (matches MATLAB behavior)
     plot_number = 1
 
+    frequency = resonance_data['Frequency'].to_numpy()
+    table = {axis: resonance_data[f'Table_{axis}'].to_numpy()
+             for axis in axes if f'Table_{axis}' in resonance_data.columns}
+
     # Generate transfer function plots for each UUT
     for uut in uuts:
         uut_output_subdir = output_subdirs.get(uut, f'{uut}_Plots_Resonance')
@@ -114,16 +135,28 @@ def main():
 
         uut_accels = [a for a in accels_config if a['uut'] == uut]
 
+        # Transmissibility for every accel on this UUT, one divide per axis
+        transfer = {}
+        for axis in axes:
+            if axis not in table:
+                continue
+            cols = [f'{uut}_{a["name"]}_{axis}' for a in uut_accels]
+            cols = [c for c in cols if c in resonance_data.columns]
+            if not cols:
+                continue
+            uut_matrix = resonance_data[cols].to_numpy(dtype=float)
+            transfer_matrix = uut_matrix / table[axis][:, None]
+            for i, col in enumerate(cols):
+                transfer[col] = transfer_matrix[:, i]
+
         for accel_info in uut_accels:
             accel_name = accel_info['name']
             uut_map_x = accel_info.get('uut_map_x', 'SS')
 
+            # UUT axis labels based on orientation mapping
+            axis_map = _AXIS_MAPS['FB' if uut_map_x == 'FB' else 'SS']
+
             for axis in axes:
-                # Determine UUT axis label based on orientation mapping
-                if uut_map_x == 'FB':
-                    axis_map = {'X': 'FB', 'Y': 'SS', 'Z': 'V'}
-                else:  # SS
-                    axis_map = {'X': 'SS', 'Y': 'FB', 'Z': 'V'}
                 axis_uut = axis_map.get(axis, axis)
 
                 # Get column names
@@ -137,12 +170,7 @@ def main():
                     print(f'Warning: {table_col} not found, skipping')
                     continue
 
-                frequency = resonance_data['Frequency'].values
-                uut_data = resonance_data[uut_accel_col].values
-                table_data = resonance_data[table_col].values
-
-                # Compute transmissibility
-                transfer_response = uut_data / table_data
+                transfer_response = transfer[uut_accel_col]
 
                 # Get natural frequency from config
                 nat_freq_key = f'{accel_name}_{axis}'
@@ -157,6 +185,7 @@ def main():
                 plot_number = save_plot(fig, plot_name, uut, plot_number,
                                         uut_output_dir)
 
+    wait_for_writes()
     print('\nResonance processing complete!')
 
 
@@ -7,12 +7,13 @@ Usage:
 
 import argparse
 import os
-import yaml
 
-from functions.parse_csv import parse_seismic_csv
+from functions._csv_cache import cached_parse_seismic_csv
 from functions.calc_seismic_parameters import calc_seismic_parameters
 from functions.process_seismic_run import process_seismic_run
 from functions.plot_style import setup_plot_style
+from functions.save_trimmed import save_trimmed
+from functions.load_config import load_config
 
 
 def main():
@@ -21,8 +22,7 @@ def main():
     args = parser.parse_args()
 
     # Load config
-    with open(args.config, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(args.config)
 
     # Configure plot style (font fallback, rcParams)
     font_used = setup_plot_style(config.get('plot', {}).get('font_name'))
@@ -34,7 +34,7 @@ def main():
     seismic = calc_seismic_parameters(config)
 
     # Parse raw CSV
-    seismic_data = parse_seismic_csv(
+    seismic_data = cached_parse_seismic_csv(
         filepath=config['seismic_file'],
         column_mapping=config['column_mapping'],
         time_unit=config.get('time_unit', 'ms'),
@@ -42,15 +42,15 @@ def main():
         duration=config.get('duration'),
     )
 
-    # Save trimmed CSV
+    # Save trimmed data (CSV unless output_format: parquet)
     script_dir = config.get('script_dir', os.path.dirname(args.config))
     output_subdir = config.get('output_subdir', f"{config['run_name']} Plots_Seismic")
     output_dir = os.path.join(script_dir, output_subdir)
     os.makedirs(output_dir, exist_ok=True)
 
-    trimmed_csv = os.path.join(script_dir, f"{config['run_name']}_trimmed.csv")
-    seismic_data.to_csv(trimmed_csv, index=False)
-    print(f'Trimmed data saved to {trimmed_csv}')
+    trimmed_path = save_trimmed(seismic_data, script_dir, f"{config['run_name']}_trimmed",
+                                config.get('output_format', 'csv'))
+    print(f'Trimmed data saved to {trimmed_path}')
 
     # Process seismic run (filter, TRS, plots, Excel)
     process_seismic_run(seismic, config, seismic_data, output_dir, script_dir=script_dir)
@@ -5,13 +5,19 @@ import pytest
 from functions.calc_trs import calc_trs
 
 
-def test_calc_trs_basic():
-    """TRS of a pure sine wave should peak near the sine frequency."""
+@pytest.fixture(scope='module')
+def sine_signal():
+    """5 s of a 10 Hz sine sampled at 1 kHz, as (time, accel)."""
     freq = 10.0  # Hz
     duration = 5.0
     dt = 0.001
     time = np.arange(0, duration, dt)
-    accel = np.sin(2 * np.pi * freq * time)
+    return time, np.sin(2 * np.pi * freq * time)
+
+
+def test_calc_trs_basic(sine_signal):
+    """TRS of a pure sine wave should peak near the sine frequency."""
+    time, accel = sine_signal
 
     freq72 = np.array([5.0, 8.0, 10.0, 12.0, 15.0, 20.0])
     damping = 0.05
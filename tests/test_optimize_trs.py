@@ -5,6 +5,12 @@ import pytest
 from functions.optimize_trs import analyze_set, optimize_trs
 
 
+@pytest.fixture(scope='module')
+def freq72():
+    """1/72-octave frequency grid used by the TRS pipeline."""
+    return 0.1 * (2 ** (np.arange(620) / 72))
+
+
 def test_analyze_set_basic():
     """TRS factor should be positive for valid inputs."""
     freq = np.array([1.0, 2.0, 5.0, 10.0, 20.0, 33.3])
@@ -14,10 +20,9 @@ def test_analyze_set_basic():
     assert factor > 0
 
 
-def test_optimize_trs_table():
+def test_optimize_trs_table(freq72):
     """Table accels should use optimization (12 starting indices)."""
     np.random.seed(42)
-    freq72 = 0.1 * (2 ** (np.arange(620) / 72))
     TRS72 = np.random.uniform(1.0, 5.0, len(freq72))
     RRS = np.full(len(freq72), 3.0)
 
@@ -28,9 +33,8 @@ def test_optimize_trs_table():
     assert len(TRS06) == len(freq06)
 
 
-def test_optimize_trs_non_table():
+def test_optimize_trs_non_table(freq72):
     """Non-table accels should always use starting index 0."""
-    freq72 = 0.1 * (2 ** (np.arange(620) / 72))
     TRS72 = np.ones(len(freq72))
     RRS = np.ones(len(freq72))
 
@@ -1,81 +1,92 @@
 """Tests for parse_csv module."""
 
-import os
-import tempfile
 import numpy as np
 import pandas as pd
 import pytest
 from functions.parse_csv import parse_seismic_csv, parse_resonance_csv
+from functions._csv_cache import cached_parse_resonance_csv, clear_cache
 
 
-def test_parse_seismic_csv_basic():
+def _write_csv(path, header, lines):
+    """Write header and data lines to path in one call; return path as str."""
+    path.write_text(header + '\n' + '\n'.join(lines) + '\n')
+    return str(path)
+
+
+def test_parse_seismic_csv_basic(tmp_path):
     """Test basic seismic CSV parsing."""
-    # Create a temporary CSV
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write('"Time (ms)","Control1 (G)","Ch1 (G)","Ch2 (G)"\n')
-        for i in range(100):
-            t = i * 10.0  # 10ms intervals
-            f.write(f'{t},{np.sin(t/100):.6f},{np.cos(t/100):.6f},{0.5:.6f}\n')
-        tmp_path = f.name
-
-    try:
-        column_mapping = {
-            'Table_X': 'Ch1 (G)',
-            'Sensor_1': 'Ch2 (G)',
-        }
-        result = parse_seismic_csv(tmp_path, column_mapping, time_unit='ms')
-
-        assert 'Time' in result.columns
-        assert 'Table_X' in result.columns
-        assert 'Sensor_1' in result.columns
-        # Time should start at 0 (in seconds)
-        assert abs(result['Time'].iloc[0]) < 1e-10
-        # Time should be in seconds
-        assert result['Time'].iloc[1] < 0.02  # 10ms = 0.01s
-    finally:
-        os.unlink(tmp_path)
-
-
-def test_parse_seismic_csv_trim():
+    times = np.arange(100) * 10.0  # 10ms intervals
+    csv_path = _write_csv(
+        tmp_path / 'seismic.csv',
+        '"Time (ms)","Control1 (G)","Ch1 (G)","Ch2 (G)"',
+        (f'{t},{np.sin(t/100):.6f},{np.cos(t/100):.6f},{0.5:.6f}' for t in times),
+    )
+
+    column_mapping = {
+        'Table_X': 'Ch1 (G)',
+        'Sensor_1': 'Ch2 (G)',
+    }
+    result = parse_seismic_csv(csv_path, column_mapping, time_unit='ms')
+
+    assert 'Time' in result.columns
+    assert 'Table_X' in result.columns
+    assert 'Sensor_1' in result.columns
+    # Time should start at 0 (in seconds)
+    assert abs(result['Time'].iloc[0]) < 1e-10
+    # Time should be in seconds
+    assert result['Time'].iloc[1] < 0.02  # 10ms = 0.01s
+
+
+def test_parse_seismic_csv_trim(tmp_path):
     """Test trimming by start time and duration."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write('"Time (ms)","Ch1 (G)"\n')
-        for i in range(1000):
-            t = -100 + i * 1.0  # 1ms intervals, starting at -100ms
-            f.write(f'{t},{np.sin(t/100):.6f}\n')
-        tmp_path = f.name
-
-    try:
-        result = parse_seismic_csv(
-            tmp_path, {'Accel': 'Ch1 (G)'},
-            time_unit='ms', trim_start=0.0, duration=0.5
-        )
-        # Time should start at 0
-        assert abs(result['Time'].iloc[0]) < 1e-10
-        # Duration should be <= 0.5s
-        assert result['Time'].iloc[-1] <= 0.5 + 1e-6
-    finally:
-        os.unlink(tmp_path)
-
-
-def test_parse_resonance_csv_basic():
+    times = -100 + np.arange(1000) * 1.0  # 1ms intervals, starting at -100ms
+    csv_path = _write_csv(
+        tmp_path / 'seismic.csv',
+        '"Time (ms)","Ch1 (G)"',
+        (f'{t},{np.sin(t/100):.6f}' for t in times),
+    )
+
+    result = parse_seismic_csv(
+        csv_path, {'Accel': 'Ch1 (G)'},
+        time_unit='ms', trim_start=0.0, duration=0.5
+    )
+    # Time should start at 0
+    assert abs(result['Time'].iloc[0]) < 1e-10
+    # Duration should be <= 0.5s
+    assert result['Time'].iloc[-1] <= 0.5 + 1e-6
+
+
+def test_parse_resonance_csv_basic(tmp_path):
     """Test basic resonance CSV parsing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write('"Frequency (Hz)","Control1 (G)","Ch1 (G)","Ch2 (G)"\n')
-        for i in range(100):
-            freq = 1.0 + i * 0.5
-            f.write(f'{freq},{0.1:.6f},{0.2:.6f},{0.15:.6f}\n')
-        tmp_path = f.name
-
-    try:
-        column_mapping = {
-            'Table_X': 'Ch1 (G)',
-            'Sensor_1': 'Ch2 (G)',
-        }
-        result = parse_resonance_csv(tmp_path, column_mapping, high_cutoff=35.0)
-
-        assert 'Frequency' in result.columns
-        assert 'Table_X' in result.columns
-        assert result['Frequency'].max() <= 35.0
-    finally:
-        os.unlink(tmp_path)
+    freqs = 1.0 + np.arange(100) * 0.5
+    csv_path = _write_csv(
+        tmp_path / 'resonance.csv',
+        '"Frequency (Hz)","Control1 (G)","Ch1 (G)","Ch2 (G)"',
+        (f'{freq},{0.1:.6f},{0.2:.6f},{0.15:.6f}' for freq in freqs),
+    )
+
+    column_mapping = {
+        'Table_X': 'Ch1 (G)',
+        'Sensor_1': 'Ch2 (G)',
+    }
+    result = parse_resonance_csv(csv_path, column_mapping, high_cutoff=35.0)
+
+    assert 'Frequency' in result.columns
+    assert 'Table_X' in result.columns
+    assert result['Frequency'].max() <= 35.0
+
+
+def test_cached_parse_resonance_csv_invalidates_on_change(tmp_path):
+    """The cache returns the parsed frame until the file changes."""
+    clear_cache()
+    header = '"Frequency (Hz)","Ch1 (G)"'
+    csv_path = _write_csv(tmp_path / 'resonance.csv', header, ['1.0,0.1', '2.0,0.2'])
+
+    first = cached_parse_resonance_csv(csv_path, {'Table_X': 'Ch1 (G)'})
+    first['Table_X'] = 0.0
+    again = cached_parse_resonance_csv(csv_path, {'Table_X': 'Ch1 (G)'})
+    assert list(again['Table_X']) == [0.1, 0.2]
+
+    _write_csv(tmp_path / 'resonance.csv', header, ['1.0,0.1', '2.0,0.2', '3.0,0.3'])
+    changed = cached_parse_resonance_csv(csv_path, {'Table_X': 'Ch1 (G)'})
+    assert len(changed) == 3
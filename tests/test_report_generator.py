@@ -0,0 +1,157 @@
+"""Tests for test_report_generator module."""
+
+import os
+import runpy
+import zipfile
+import numpy as np
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.table import _Cell
+
+import functions.test_report_generator as trg
+from functions.save_trs import save_trs
+
+Image = pytest.importorskip('PIL.Image')
+
+
+@pytest.fixture
+def photo_cache(tmp_path, monkeypatch):
+    """Point the resized-photo cache at an empty temporary directory."""
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(trg, '_PHOTO_CACHE_DIR', str(cache_dir))
+    monkeypatch.setattr(trg, '_photo_cache_pruned', False)
+    return cache_dir
+
+
+def _jpeg(path, size):
+    Image.new('RGB', size, (200, 120, 40)).save(path, format='JPEG')
+    return str(path)
+
+
+def test_resize_photo_caches_only_resized(tmp_path, photo_cache):
+    """Photos embedded unchanged skip the cache; downsized ones are cached."""
+    small = _jpeg(tmp_path / 'small.jpg', (400, 300))
+    large = _jpeg(tmp_path / 'large.jpg', (1800, 1200))
+
+    buf = trg.TestReportGenerator._resize_photo(small, max_px=900)
+    with open(small, 'rb') as f:
+        assert buf.getvalue() == f.read()
+    assert not photo_cache.exists()
+
+    buf = trg.TestReportGenerator._resize_photo(large, max_px=900)
+    assert Image.open(buf).size == (900, 600)
+    assert len(os.listdir(photo_cache)) == 1
+
+
+def test_jpeg_dims_only_baseline_and_progressive(tmp_path):
+    """Only 8-bit SOF0-SOF2 JPEGs report dimensions (and may be embedded as-is)."""
+    path = _jpeg(tmp_path / 'photo.jpg', (400, 300))
+    assert trg._jpeg_dims(path) == (400, 300)
+
+    data = open(path, 'rb').read()
+    sof = data.index(b'\xff\xc0')
+    for marker, precision in [(0xC3, 8), (0xC9, 8), (0xC1, 12)]:
+        patched = bytearray(data)
+        patched[sof + 1] = marker
+        patched[sof + 4] = precision
+        (tmp_path / 'patched.jpg').write_bytes(bytes(patched))
+        assert trg._jpeg_dims(str(tmp_path / 'patched.jpg')) is None
+
+
+def test_prune_photo_cache_drops_least_recent(photo_cache):
+    """Pruning removes the oldest entries and stale temp files, keeping the rest."""
+    photo_cache.mkdir()
+    for i, name in enumerate(['a.jpg', 'b.jpg', 'c.jpg']):
+        path = photo_cache / name
+        path.write_bytes(b'x' * 100)
+        os.utime(path, ns=(10**18 + i * 10**9,) * 2)
+    stale = photo_cache / 'old.tmp'
+    stale.write_bytes(b'x')
+    os.utime(stale, ns=(10**9, 10**9))
+    (photo_cache / 'new.tmp').write_bytes(b'x')
+
+    trg._prune_photo_cache(max_bytes=250)
+
+    assert sorted(os.listdir(photo_cache)) == ['b.jpg', 'c.jpg', 'new.tmp']
+
+
+_EXAMPLE_CONFIG = os.path.join(os.path.dirname(__file__), '..', 'examples',
+                               'WCC_Booster', 'project_config.py')
+
+_PLOT_NAMES = [
+    '1_Run_1_TH_Table_X.png', '2_Run_1_TRS_Table_X.png',
+    '3_Run_1_TRSvsRRS_All_Table.png', '4_Run_1_CC.png',
+    '5_Run_1_TH_UUT_1_C_X.png',
+]
+
+
+@pytest.fixture
+def report_cfg(tmp_path, photo_cache):
+    """Example project config with a minimal template and one seismic run's inputs."""
+    template = Document()
+    for style in ('Cover Header', 'SubHeading', 'Tight Spacing'):
+        template.styles.add_style(style, WD_STYLE_TYPE.PARAGRAPH)
+    template.add_paragraph('template placeholder')
+    template.save(tmp_path / 'template.docx')
+
+    plot_dir = tmp_path / 'plots'
+    plot_dir.mkdir()
+    for i, name in enumerate(_PLOT_NAMES):
+        Image.new('RGB', (160, 120), (40 * i, 90, 160)).save(plot_dir / name)
+
+    photo_dir = tmp_path / 'photos'
+    photo_dir.mkdir()
+    _jpeg(photo_dir / 'IMG_001.jpg', (400, 300))
+    _jpeg(photo_dir / 'IMG_002.jpg', (1200, 900))
+
+    freq72 = 0.1 * (2 ** (np.arange(620) / 72))
+    seismic = {'freq72': freq72, 'RRS_h': np.full(620, 2.0), 'RRS_v': np.full(620, 1.0),
+               'lowResonance': 5.0, 'lowCutoff': 3.8}
+    freq06 = freq72[0::12]
+    save_trs('Run_1', ['X', 'Y', 'Z'], {f'Table_{a}': freq06 for a in 'XYZ'},
+             {f'Table_{a}': np.full(len(freq06), 2.5) for a in 'XYZ'},
+             seismic, str(tmp_path))
+
+    project = runpy.run_path(_EXAMPLE_CONFIG)['project_info']
+    cfg = {k: v for k, v in project.items() if k != 'reports'}
+    cfg['template'] = str(tmp_path / 'template.docx')
+    cfg['resonance_dirs'] = {}
+    cfg['run_plots'] = {'Run 1': {
+        'seismic_dir': str(plot_dir),
+        'trs_excel': str(tmp_path / 'Run_1_Table_TRSvsRRS.xlsx'),
+        'pre_test_photos': {'dir': str(photo_dir)},
+        'post_test_photos': str(photo_dir),
+    }}
+    return cfg
+
+
+def test_generate_report(tmp_path, report_cfg):
+    """A report builds, reopens, and keeps merged headers, table text and pictures."""
+    trg._SECTION_CACHE.clear()
+    first = trg.TestReportGenerator(report_cfg).generate(str(tmp_path / 'first.docx'))
+    assert len(trg._SECTION_CACHE) == 4
+
+    doc = Document(first)
+    assert not any('template placeholder' in p.text for p in doc.paragraphs)
+    assert doc.tables[0].cell(0, 0).text == 'Manufacturer'
+
+    # TRS table: merged direction headers over Freq/RRS/TRS, values from the workbook
+    trs = next(t for t in doc.tables if t.cell(0, 0).text == 'X Direction')
+    header = trs.rows[0]._tr.tc_lst
+    assert [_Cell(tc, trs).text for tc in header] == ['X Direction', 'Y Direction', 'Z Direction']
+    assert [tc.tcPr.find(qn('w:gridSpan')).get(qn('w:val')) for tc in header] == ['3'] * 3
+    assert [c.text for c in trs.rows[1].cells[:3]] == ['Freq.\n(Hz)', 'RRS\n(g)', 'TRS\n(g)']
+    assert trs.cell(2, 2).text == '2.50'
+
+    # Every plot plus both photos for pre- and post-test
+    assert len(doc.inline_shapes) == len(_PLOT_NAMES) + 4
+    with zipfile.ZipFile(first) as z:
+        media = [n for n in z.namelist() if n.startswith('word/media/')]
+    assert len(media) == len(_PLOT_NAMES) + 2
+
+    # A second build reuses the cached static sections and gives the same body
+    second = trg.TestReportGenerator(report_cfg).generate(str(tmp_path / 'second.docx'))
+    with zipfile.ZipFile(first) as a, zipfile.ZipFile(second) as b:
+        assert a.read('word/document.xml') == b.read('word/document.xml')
@@ -0,0 +1,94 @@
+"""Tests for save_trs module."""
+
+import os
+import numpy as np
+import pytest
+from openpyxl import load_workbook
+from functions.save_trs import save_trs
+
+
+def _seismic():
+    freq72 = 0.1 * (2 ** (np.arange(620) / 72))
+    return {
+        'freq72': freq72,
+        'RRS_h': np.linspace(1.0, 3.0, len(freq72)),
+        'RRS_v': np.linspace(0.5, 1.5, len(freq72)),
+        'lowResonance': 5.0,
+        'lowCutoff': 3.8,
+    }
+
+
+def _trs_inputs(seismic, axes):
+    freq06 = seismic['freq72'][0::12]
+    freq06_all = {f'Table_{a}': freq06 for a in axes}
+    TRS06_all = {f'Table_{a}': np.full(len(freq06), 2.0 + i)
+                 for i, a in enumerate(axes)}
+    return freq06, freq06_all, TRS06_all
+
+
+def test_save_trs_layout(tmp_path):
+    """Headers, data columns and K/L annotations match the MATLAB layout."""
+    seismic = _seismic()
+    axes = ['X', 'Y', 'Z']
+    freq06, freq06_all, TRS06_all = _trs_inputs(seismic, axes)
+
+    save_trs('Run_1', axes, freq06_all, TRS06_all, seismic, str(tmp_path))
+
+    path = os.path.join(tmp_path, 'Run_1_Table_TRSvsRRS.xlsx')
+    ws = load_workbook(path).active
+
+    assert ws['A1'].value == 'X Direction'
+    assert ws['D1'].value == 'Y Direction'
+    assert ws['G1'].value == 'Z Direction'
+    assert [ws.cell(2, c).value for c in range(1, 4)] == ['Freq.\n(Hz)', 'RRS\n(g)', 'TRS\n(g)']
+
+    # Only frequencies above 1 Hz, rounded to 2 decimals
+    expected_freq = np.round(freq06[freq06 > 1.0], 2)
+    col_a = [ws.cell(3 + i, 1).value for i in range(len(expected_freq))]
+    np.testing.assert_array_equal(col_a, expected_freq)
+    assert ws.cell(3 + len(expected_freq), 1).value is None
+
+    # RRS column: horizontal for X, vertical for Z
+    rrs_h = np.round(np.interp(expected_freq[0], seismic['freq72'], seismic['RRS_h']), 2)
+    assert ws['B3'].value == pytest.approx(rrs_h, abs=0.011)
+    assert ws['H3'].value < ws['B3'].value
+    assert ws['C3'].value == 2.0
+    assert ws['F3'].value == 3.0
+    assert ws['I3'].value == 4.0
+
+    assert ws['K3'].value == 5.0
+    assert ws['L3'].value == '<- Lowest Resonance'
+    assert ws['K4'].value == 3.8
+    assert ws['L4'].value == '<- Cuttoff Frequency'
+
+
+def test_save_trs_missing_axis(tmp_path):
+    """Axes without Table TRS data leave their columns empty."""
+    seismic = _seismic()
+    _, freq06_all, TRS06_all = _trs_inputs(seismic, ['X'])
+
+    save_trs('Run_2', ['X', 'Y', 'Z'], freq06_all, TRS06_all, seismic, str(tmp_path))
+
+    ws = load_workbook(os.path.join(tmp_path, 'Run_2_Table_TRSvsRRS.xlsx')).active
+    assert ws['A3'].value is not None
+    assert ws['D3'].value is None
+    assert ws['G3'].value is None
+
+
+def test_save_trs_openpyxl_fallback(tmp_path, monkeypatch):
+    """Without xlsxwriter the openpyxl writer produces the same cells."""
+    import functions.save_trs as save_trs_module
+
+    seismic = _seismic()
+    axes = ['X', 'Y', 'Z']
+    _, freq06_all, TRS06_all = _trs_inputs(seismic, axes)
+
+    save_trs('Run_1', axes, freq06_all, TRS06_all, seismic, str(tmp_path / 'a'))
+    monkeypatch.setattr(save_trs_module, 'xlsxwriter', None)
+    save_trs('Run_1', axes, freq06_all, TRS06_all, seismic, str(tmp_path / 'b'))
+
+    def _values(d):
+        ws = load_workbook(os.path.join(tmp_path, d, 'Run_1_Table_TRSvsRRS.xlsx')).active
+        return [tuple(r) for r in ws.iter_rows(values_only=True)]
+
+    assert _values('a') == _values('b')